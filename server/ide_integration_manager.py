@@ -14,6 +14,7 @@ SPDX-License-Identifier: Proprietary
 """
 
 import difflib
+import functools
 import json
 import os
 import platform
@@ -37,6 +38,23 @@ from .shared_config import SharedConfigManager, get_user_data_directory, get_ser
 from easy_mcp.server import MCPLogger
 
 
+# The platform never changes while the server runs, so the platform key used to
+# pick an integration's path template (e.g. "windows"/"macos"/"linux") is resolved once.
+# platform.system() returns "Darwin" on macOS; the config schema calls it "macos".
+_CURRENT_PLATFORM = platform.system().lower()
+_CONFIG_PLATFORM_KEY = "macos" if _CURRENT_PLATFORM == "darwin" else _CURRENT_PLATFORM
+
+
+@functools.lru_cache(maxsize=256)
+def _expand_path_template(path_template: str) -> Path:
+    """Expand %VARS%/$VARS and ~ in an integration path template, once per template.
+    
+    The environment and home directory do not change while the server runs, and the
+    same few templates are re-resolved on every registration poll.
+    """
+    return Path(os.path.expanduser(os.path.expandvars(path_template)))
+
+
 class IDEIntegrationManager:
     """
     Manages IDE integration registration, backup, and restoration.
@@ -542,9 +560,8 @@ class IDEIntegrationManager:
             Path to config file, or None if not found
         """
         # Check for config_file_override (e.g., JetBrains uses ~/.junie/mcp.json)
-        current_platform = platform.system().lower()
-        # Map darwin to macos for config key lookup (platform.system() returns "Darwin" on macOS)
-        config_platform_key = "macos" if current_platform == "darwin" else current_platform
+        current_platform = _CURRENT_PLATFORM
+        config_platform_key = _CONFIG_PLATFORM_KEY
         MCPLogger.log("IDE", f"Auto-registration: {integration_id} resolving config path for platform={current_platform} (config_key={config_platform_key})")
         
         override = auto_reg_format.get("config_file_override")
@@ -592,13 +609,8 @@ class IDEIntegrationManager:
         Returns:
             Expanded Path object
         """
-        # Expand environment variables
-        expanded = os.path.expandvars(path_template)
-        
-        # Expand user home
-        expanded = os.path.expanduser(expanded)
-        
-        return Path(expanded)
+        # Environment variables first, then user home (memoized per template)
+        return _expand_path_template(path_template)
     
     def _read_config_file(self, config_path: Path, auto_reg_format: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1051,7 +1063,7 @@ class IDEIntegrationManager:
         Returns:
             Modified server_entry with cmd /c wrapping on Windows, unchanged on other platforms
         """
-        if platform.system() != "Windows":
+        if _CURRENT_PLATFORM != "windows":
             return server_entry
         
         if not isinstance(server_entry, dict):
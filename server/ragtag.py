@@ -20,24 +20,39 @@ import argparse
 import sys
 import os
 import threading
+import traceback
 import time
 import subprocess
 import platform
 import uuid
 import getpass,base64,atexit
+import functools
 import hmac  # constant-time API-key comparison (review D6)
+import hashlib
 import re
+import stat
 import html
 import mimetypes
+import mmap
+import email.utils
+import types
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple, Optional
 from easy_mcp import MCPServer
 from easy_mcp.server import MCPLogger
 from .tools import ALL_TOOLS, HANDLERS, ORIGINAL_TOOLS, set_server, notify_all_tools_registered
 from .tools import local as local_tools
 from .tools import remote as remote_tools
+from .shared_config import get_config_manager, SharedConfigManager, apply_synthetic_mypc_entry, sync_mcpservers_synthetic_entry_from_server_config, install_sigterm_flush
+from .oauth2_handler import OAuth2Handler
 from platformdirs import user_data_dir
 
+try:
+    import orjson  # optional: faster JSON encoding for API responses
+except ImportError:
+    orjson = None
+
 # Global variables for authentication
 AUTHORIZED_USERS = {}
 DISABLE_AUTH = False  # Global switch to disable authentication for testing
@@ -67,12 +82,250 @@ ENABLE_HOSTNAME_UUID_AUTH = True
 # Canonical OAuth discovery paths. check_global_auth's unauthenticated allow-list and
 # handle_default_request's discovery route MUST share this exact set (review A1): a path
 # variant allowed through auth but not served would fall through toward the homepage.
-OAUTH_DISCOVERY_PATHS = (
+OAUTH_DISCOVERY_PATHS = frozenset((
     '/.well-known/oauth-authorization-server',
     '/.well-known/oauth-authorization-server/',
     '/.well-known/oauth-authorization-server/sse',
     '/sse/.well-known/oauth-authorization-server',
-)
+))
+
+
+# Fixed error responses used on hot paths. The header dicts are built once and copied per
+# response (a small dict copy, not a literal rebuild), because the server may add its own
+# headers (CORS, Content-Length) to the dict it is handed.
+NOT_FOUND_HEADERS = {"Content-Type": "text/plain; charset=utf-8", "Cache-Control": "no-store"}
+UNAUTHORIZED_HEADERS = {
+    "WWW-Authenticate": 'Basic realm="Aura Friday mcp-link server"',
+    "Content-Type": "text/plain; charset=utf-8",
+    "Cache-Control": "no-store",
+}
+
+
+def get_url_auth_params(server_instance):
+    """Return (url_user, url_api_key) from the request's query parameters.
+
+    The user comes from 'user', else 'username'; the key from 'RAGTAG_API_KEY'. The first
+    value of each wins, and missing parameters give None.
+    """
+    query_params = getattr(server_instance, 'query_params', None) or {}
+    user_params = query_params.get('user') or query_params.get('username')
+    api_key_params = query_params.get('RAGTAG_API_KEY')
+    return (user_params[0] if user_params else None,
+            api_key_params[0] if api_key_params else None)
+
+
+def request_etag_matches(request_headers, etag):
+    """True if the request's If-None-Match lists etag (so a 304 can be sent)."""
+    if_none_match = get_request_header(request_headers, 'If-None-Match')
+    return bool(if_none_match) and any(tag.strip() == etag for tag in if_none_match.split(','))
+
+
+def get_request_header(request_headers, header_name):
+    """Look up a request header by its canonical name, falling back to the all-lowercase key.
+
+    The parsed header dict comes from easy_mcp and keeps the client's spelling, so both
+    forms are tried - in one helper rather than a chained expression at every call site.
+    """
+    return request_headers.get(header_name) or request_headers.get(header_name.lower())
+
+
+def not_found_response():
+    """Return the standard uncacheable 404 (status, headers, body) tuple."""
+    return "404 Not Found", dict(NOT_FOUND_HEADERS), "Not Found"
+
+
+def unauthorized_response():
+    """Return the standard 401 Basic-auth challenge (status, headers, body) tuple."""
+    return "401 Unauthorized", dict(UNAUTHORIZED_HEADERS), "Access Denied"
+
+
+# Hostname-UUID credential: {api-key-uuid}-{real-hostname} (see ENABLE_HOSTNAME_UUID_AUTH)
+UUID_HOST_RE = re.compile(r'^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-(.+)$', re.IGNORECASE)
+
+class AuthorizedUserRecord(NamedTuple):
+    """Read-only snapshot of one AUTHORIZED_USERS entry, as used on the auth hot path."""
+    username: str
+    api_key: Optional[str]
+    permissions: frozenset
+
+
+# Auth-path views of AUTHORIZED_USERS: username -> record and api_key -> record, so Bearer,
+# hostname-UUID and the final key check are single dict lookups plus tuple field access
+# instead of user scans and nested dict .get() chains. AUTHORIZED_USERS itself stays plain
+# dicts because it lives inside (and is saved back to) the config. Rebuilt automatically when
+# AUTHORIZED_USERS is reassigned; in-place mutations must call refresh_authorized_users_index().
+_AUTHORIZED_USER_RECORDS = {}
+_API_KEY_TO_USER_RECORD = {}
+_indexed_authorized_users = None  # the AUTHORIZED_USERS object the views were built from
+
+
+def refresh_authorized_users_index():
+    """Rebuild the username/api_key record views from AUTHORIZED_USERS."""
+    global _AUTHORIZED_USER_RECORDS, _API_KEY_TO_USER_RECORD, _indexed_authorized_users
+    user_records = {}
+    for user, user_config in AUTHORIZED_USERS.items():
+        if not isinstance(user_config, dict):
+            continue
+        api_key = user_config.get('api_key')
+        permissions = user_config.get('permissions') or ()
+        user_records[user] = AuthorizedUserRecord(
+            username=user,
+            api_key=api_key if isinstance(api_key, str) and api_key else None,
+            permissions=frozenset(p for p in permissions if isinstance(p, str)),
+        )
+    _AUTHORIZED_USER_RECORDS = user_records
+    _API_KEY_TO_USER_RECORD = {record.api_key: record for record in user_records.values() if record.api_key}
+    _indexed_authorized_users = AUTHORIZED_USERS
+
+
+def get_authorized_user_record(username):
+    """Return the AuthorizedUserRecord for username, or None if not an authorized user."""
+    if _indexed_authorized_users is not AUTHORIZED_USERS:
+        refresh_authorized_users_index()
+    return _AUTHORIZED_USER_RECORDS.get(username)
+
+
+def find_user_by_api_key(offered_api_key):
+    """Return the username whose API key is offered_api_key, or None.
+
+    The dict lookup only nominates a candidate; the hit is confirmed against the record's
+    key with api_key_matches_constant_time (review D6) before it is trusted.
+    """
+    if _indexed_authorized_users is not AUTHORIZED_USERS:
+        refresh_authorized_users_index()
+    if not isinstance(offered_api_key, str):
+        return None
+    candidate_record = _API_KEY_TO_USER_RECORD.get(offered_api_key)
+    if candidate_record is None:
+        return None
+    if not api_key_matches_constant_time(offered_api_key, candidate_record.api_key):
+        return None
+    return candidate_record.username
+
+
+# Longest base64 credential string worth memoizing; anything longer is decoded uncached so
+# junk headers cannot fill the parse cache with large strings.
+BASIC_CREDENTIALS_CACHE_MAX_LENGTH = 512
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_basic_credentials_cached(encoded_credentials):
+    try:
+        decoded_credentials = base64.b64decode(encoded_credentials).decode('utf-8')
+    except ValueError:  # binascii.Error and UnicodeDecodeError are both ValueErrors
+        return None
+    if ':' not in decoded_credentials:
+        return None
+    username, password = decoded_credentials.split(':', 1)
+    return username, password
+
+
+def parse_basic_credentials(encoded_credentials):
+    """Decode a base64 'user:key' credential into (username, password), or None if malformed.
+
+    Clients resend the same Authorization header on every request, so the decode/split is
+    memoized per header value (bounded LRU).
+    """
+    if len(encoded_credentials) > BASIC_CREDENTIALS_CACHE_MAX_LENGTH:
+        return _parse_basic_credentials_cached.__wrapped__(encoded_credentials)
+    return _parse_basic_credentials_cached(encoded_credentials)
+
+
+# OAuth state caches, so auth and routing do not deep-copy the whole config per request:
+#   - access-token lookups: token -> (client_name or None, expires_at), or (None, None) for
+#     "not an OAuth token" so plain API-key Bearer requests skip the config load too;
+#   - the settings[0].oauth.enabled flag (None = not loaded yet).
+# Expiry is checked against expires_at at use time; everything else (revocation, refresh
+# rotation, client pruning, enabling/disabling OAuth) goes through a config save, so both
+# are dropped on any config change and after every /oauth2/ request. The generation counter
+# stops a lookup that raced with an invalidation from re-caching pre-change data.
+OAUTH_TOKEN_CACHE_MAX_ENTRIES = 1024
+_OAUTH_TOKEN_CACHE = {}
+_oauth_enabled_flag = None
+_oauth_cache_generation = 0
+_OAUTH_CACHE_LOCK = threading.Lock()
+_oauth_cache_callback_registered = False
+
+
+def invalidate_oauth_caches(changed_config=None):
+    """Drop cached OAuth token lookups and the enabled flag (also a config-change callback)."""
+    global _oauth_enabled_flag, _oauth_cache_generation
+    with _OAUTH_CACHE_LOCK:
+        _OAUTH_TOKEN_CACHE.clear()
+        _oauth_enabled_flag = None
+        _oauth_cache_generation += 1
+
+
+def _load_oauth_section_for_cache():
+    """Return (generation, copy of settings[0].oauth) for filling the OAuth caches.
+
+    Copies only the oauth section from the manager's in-memory cache rather than
+    deep-copying the whole config via load_config().
+    """
+    global _oauth_cache_callback_registered
+    config_manager = get_config_manager()
+    if not _oauth_cache_callback_registered:
+        config_manager.register_config_change_callback(invalidate_oauth_caches, wants_config=False)
+        _oauth_cache_callback_registered = True
+
+    with _OAUTH_CACHE_LOCK:
+        generation = _oauth_cache_generation
+    oauth_data = config_manager.get_settings_sections_copy('oauth')['oauth']
+    return generation, oauth_data if isinstance(oauth_data, dict) else {}
+
+
+def is_oauth_enabled():
+    """Return settings[0].oauth.enabled, cached until the next config change."""
+    global _oauth_enabled_flag
+    oauth_enabled = _oauth_enabled_flag
+    if oauth_enabled is not None:
+        return oauth_enabled
+
+    generation, oauth_data = _load_oauth_section_for_cache()
+    oauth_enabled = bool(oauth_data.get("enabled", False))
+    with _OAUTH_CACHE_LOCK:
+        if generation == _oauth_cache_generation:
+            _oauth_enabled_flag = oauth_enabled
+    return oauth_enabled
+
+
+def resolve_oauth_access_token(token):
+    """Look up an OAuth access token, returning (client_name, expires_at).
+
+    expires_at is None when the token is not a known OAuth access token; client_name is
+    None when the token exists but its client has been removed. The caller decides
+    validity against time.time().
+    """
+    with _OAUTH_CACHE_LOCK:
+        cached_entry = _OAUTH_TOKEN_CACHE.get(token)
+    if cached_entry is not None:
+        return cached_entry
+
+    generation, oauth_data = _load_oauth_section_for_cache()
+    token_data = oauth_data.get('access_tokens', {}).get(token)
+    if token_data is None:
+        resolved_entry = (None, None)
+    else:
+        client_id = token_data['client_id']
+        client_info = oauth_data.get('clients', {}).get(client_id)
+        client_name = client_info.get('client_name', client_id) if client_info is not None else None
+        resolved_entry = (client_name, token_data['expires_at'])
+
+    with _OAUTH_CACHE_LOCK:
+        if generation == _oauth_cache_generation:
+            if len(_OAUTH_TOKEN_CACHE) >= OAUTH_TOKEN_CACHE_MAX_ENTRIES:
+                _OAUTH_TOKEN_CACHE.clear()
+            _OAUTH_TOKEN_CACHE[token] = resolved_entry
+    return resolved_entry
+
+
+def log_exception(category, message):
+    """Log message and the traceback of the exception being handled as one entry.
+
+    Call from an except block. One MCPLogger write instead of a message line plus a
+    separate traceback line.
+    """
+    MCPLogger.log(category, f"{message}\nTraceback:\n{traceback.format_exc()}")
 
 
 def mask_secret_for_logging(secret_value):
@@ -478,6 +731,15 @@ FAVICON_B64 = "AAABAAEAEBAAAAEAIABoBAAAFgAAACgAAAAQAAAAIAAAAAEAIAAAAAAAAAQAAAAAA
               "lTL8SH8i6pprE9s3ljP9Tncc5JGOLfdfex/o7QAAAAAAAAAAgyXuwX0g6e6DJe45dRrjv3Yb5MB4HeVyaxPbHwAAAAB3HOWnbxbekpYz/QaWM/0+eB3l9Yoq9IYAAAAAAAAAAAAAAACBJO3Teh7n9JMw" + \
               "+mQAAAAAljP9Anwg6ZR0GuKvcxnhpWsT2xV/IuvdeR3m94Qm77cAAAAAAAAAAAAAAAAAAAAAAAAAAIsq9Ip5Hubzeh7m7n4h6tKGJ/C6hCXu03wg6d94HeX1fyLr4wAAAAAAAAAAAAAAAAAAAAAAAAAA" + \
               "AAAAAAAAAAAAAAAAljP9RpYz/bKNLPbIgiTt24Ik7d6JKfPYljP9sgAAAAAAAAAAAAAAAAAAAAAAAAAA//8AAP/vAAD/xwAA/4cAAPAHAADH8QAAjBwAACYMAABj+gAAEYYAAA/sAACvtQAAk5kAAM4jAADgDwAA+B8AAA=="
+FAVICON_BYTES = base64.b64decode(FAVICON_B64)
+FAVICON_ETAG = '"' + hashlib.blake2b(FAVICON_BYTES, digest_size=8).hexdigest() + '"'
+FAVICON_RESPONSE_HEADERS = {
+    "Content-Type": "image/x-icon",
+    "Content-Length": str(len(FAVICON_BYTES)),
+    "Cache-Control": "public, max-age=31536000",  # Cache for 1 year
+    "ETag": FAVICON_ETAG,
+}
+
 
 def get_connection_info(args,master_dir):
     """
@@ -611,24 +873,30 @@ def manage_ragtag_config(fris):
     # with unbound config_manager/ragtag_config and raising a confusing NameError below
     # (review A7).
     try:
-        from .shared_config import get_config_manager
         config_manager = get_config_manager()
-        
-        # Get existing ragtag config or empty dict
-        ragtag_config = config_manager.get_ragtag_config()
         master_dir = config_manager._find_master_directory()
         
     except ImportError as shared_config_import_error:
         MCPLogger.log("Config", f"Fatal: shared config manager unavailable: {shared_config_import_error}")
         raise
 
+    # Load the full config ONCE: every branch below mutates this copy (ragtag section and the
+    # synthetic mcpServers.mypc entry) and it is saved at most once at the bottom, instead of
+    # several update_ragtag_config/load_config round trips with races in between.
+    full_config = config_manager.load_config()
+    dirty = False
+    new_api_key = None  # set when this run generates a key the mypc entry must carry
+    
+    # Get existing ragtag config or empty dict
+    ragtag_config = SharedConfigManager.get_settings_value(full_config, "ragtag", {})
+    if not isinstance(ragtag_config, dict):
+        ragtag_config = {}
     
     # Check if ragtag config exists
-    file_was_created = False
     if not ragtag_config or not ragtag_config.get("authorized_users"):
-        file_was_created = True
         # Generate new UUID for API key
         api_key = str(uuid.uuid4())
+        new_api_key = api_key
         
         # Get current logged-in user
         try:
@@ -647,37 +915,27 @@ def manage_ragtag_config(fris):
                 }
             }
         }
+        SharedConfigManager.set_settings_value(full_config, "ragtag", ragtag_config)
+        dirty = True
         
-        # Save configuration to shared config
-        try:
-            config_manager.update_ragtag_config(ragtag_config)
-            MCPLogger.log("Config", f"Created new ragtag configuration in nativemessaging.json")
-            MCPLogger.log("Server", f"{GRN}Generated new API key: {mask_secret_for_logging(api_key)}{NORM}")
-            MCPLogger.log("Server", f"{GRN}Added authorized user: {current_user}{NORM}")
-            
-            # Also update all mcpServers entries with the real API key and URL
-            from .shared_config import update_mcpservers_with_api_key_and_url
-            if update_mcpservers_with_api_key_and_url(api_key):
-                MCPLogger.log("Config", f"Updated all mcpServers entries with API key and URL")
-        except Exception as e:
-            MCPLogger.log("Config", f"Error creating ragtag config: {e}")
-            # Keep the config in memory even if save failed
+        MCPLogger.log("Config", f"Created new ragtag configuration in nativemessaging.json")
+        MCPLogger.log("Server", f"{GRN}Generated new API key: {mask_secret_for_logging(api_key)}{NORM}")
+        MCPLogger.log("Server", f"{GRN}Added authorized user: {current_user}{NORM}")
         fris._emit_message(f"* NEW Login credentials - Username: {current_user}, API Key: {mask_secret_for_logging(api_key)} (full key is in the Settings page / nativemessaging.json)")
 
     else:
         # Use existing ragtag configuration  
         MCPLogger.log("Config", f"Loaded existing ragtag configuration from nativemessaging.json")
-        if not file_was_created:
-            MCPLogger.log("Server", f"{BLU}Using existing configuration{NORM}")
-        else:
-            MCPLogger.log("Server", f"{GRN}Created new configuration{NORM}")
+        MCPLogger.log("Server", f"{BLU}Using existing configuration{NORM}")
     
-    # Store authorized users globally
-    AUTHORIZED_USERS = ragtag_config.get("authorized_users", {})
+    # Store authorized users globally. This dict lives inside full_config, so adding the
+    # current user below is automatically part of the single save.
+    AUTHORIZED_USERS = ragtag_config.setdefault("authorized_users", {})
     # Read disable_auth setting (defaults to False for security)
     DISABLE_AUTH = ragtag_config.get("disable_auth", False)
     # Read hostname-UUID auth gate (defaults to True for backward compatibility, review B4)
     ENABLE_HOSTNAME_UUID_AUTH = ragtag_config.get("enable_hostname_uuid_auth", True)
+    refresh_authorized_users_index()
     MCPLogger.log("Config", f"Loaded {len(AUTHORIZED_USERS)} authorized users")
     if not ENABLE_HOSTNAME_UUID_AUTH:
         MCPLogger.log("Config", f"Hostname-UUID authentication is disabled (ragtag.enable_hostname_uuid_auth=false)")
@@ -685,9 +943,9 @@ def manage_ragtag_config(fris):
         MCPLogger.log("Config", f"{YEL}WARNING: Authentication is DISABLED (nativemessaging.json ragtag.disable_auth=true){NORM}")
     
     # Check if current user is in authorized users, add them if not
-    config_updated = False
+    current_user = None
     try:
-        current_user = getpass.getuser()
+        current_user = get_current_os_username()
         if current_user in AUTHORIZED_USERS:
             api_key = AUTHORIZED_USERS[current_user].get('api_key')
             MCPLogger.log("Server", f"{GRN}Current user: {current_user}{NORM}")
@@ -704,10 +962,8 @@ def manage_ragtag_config(fris):
                 "created": datetime.now().isoformat(),
                 "permissions": ["read", "write", "admin"]
             }
-            
-            # Update the ragtag configuration
-            ragtag_config["authorized_users"] = AUTHORIZED_USERS
-            config_updated = True
+            refresh_authorized_users_index()
+            dirty = True
             
             MCPLogger.log("Server", f"{GRN}Added current user '{current_user}' to authorized users{NORM}")
             MCPLogger.log("Server", f"{GRN}Generated new API key: {mask_secret_for_logging(new_api_key)}{NORM}")
@@ -715,47 +971,44 @@ def manage_ragtag_config(fris):
     except Exception as e:
         MCPLogger.log("Server", f"{RED}Error getting current user info: {e}{NORM}")
     
-    # Save updated configuration if we added a user
-    if config_updated:
-        try:
-            config_manager.update_ragtag_config(ragtag_config)
-            MCPLogger.log("Config", f"{GRN}Updated ragtag configuration with new authorized user{NORM}")
+    # Point the synthetic mcpServers.mypc entry at us with the right key: always when this run
+    # generated one, otherwise only if some mcpServers entry still lacks a real Bearer key.
+    try:
+        if new_api_key is not None:
+            if apply_synthetic_mypc_entry(full_config, new_api_key):
+                dirty = True
+        elif current_user in AUTHORIZED_USERS:
+            api_key = AUTHORIZED_USERS[current_user].get('api_key')
+            needs_update = False
+            for server_name, server_config in full_config.get("mcpServers", {}).items():
+                if isinstance(server_config, dict) and "headers" in server_config:
+                    current_auth = server_config["headers"].get("Authorization", "")
+                    if current_auth == "Bearer put-your-real-key-here" or not current_auth.startswith("Bearer "):
+                        needs_update = True
+                        break
             
-            # Also update all mcpServers entries with the new API key and URL
-            from .shared_config import update_mcpservers_with_api_key_and_url
-            if update_mcpservers_with_api_key_and_url(new_api_key):
-                MCPLogger.log("Config", f"Updated all mcpServers entries with new API key and URL")
-        except Exception as e:
-            MCPLogger.log("Config", f"{RED}Error saving updated ragtag config: {e}{NORM}")
+            if needs_update and apply_synthetic_mypc_entry(full_config, api_key):
+                dirty = True
+    except Exception as e:
+        MCPLogger.log("Config", f"{RED}Error updating mcpServers entries: {e}{NORM}")
     
-    # For existing users, also ensure mcpServers has the correct API key
-    elif not file_was_created:
+    # Single write for everything above (the in-memory config is kept even if the save fails)
+    if dirty:
         try:
-            current_user = getpass.getuser()
-            if current_user in AUTHORIZED_USERS:
-                api_key = AUTHORIZED_USERS[current_user].get('api_key')
-                # Check if any mcpServers entry needs updating
-                full_config = config_manager.load_config()
-                needs_update = False
-                
-                if "mcpServers" in full_config:
-                    for server_name, server_config in full_config["mcpServers"].items():
-                        if isinstance(server_config, dict) and "headers" in server_config:
-                            current_auth = server_config["headers"].get("Authorization", "")
-                            if current_auth == "Bearer put-your-real-key-here" or not current_auth.startswith("Bearer "):
-                                needs_update = True
-                                break
-                
-                if needs_update:
-                    from .shared_config import update_mcpservers_with_api_key_and_url
-                    if update_mcpservers_with_api_key_and_url(api_key):
-                        MCPLogger.log("Config", f"Updated all mcpServers entries with API key and URL for existing user")
+            if config_manager.save_config(full_config):
+                MCPLogger.log("Config", f"{GRN}Saved ragtag configuration and mcpServers entries{NORM}")
         except Exception as e:
-            MCPLogger.log("Config", f"{RED}Error updating mcpServers for existing user: {e}{NORM}")
+            MCPLogger.log("Config", f"{RED}Error saving ragtag config: {e}{NORM}")
     
     return AUTHORIZED_USERS,master_dir
 
 
+@functools.lru_cache(maxsize=1)
+def get_current_os_username():
+    """Return getpass.getuser() for this process (it cannot change while we run)."""
+    return getpass.getuser()
+
+
 def get_current_user_api_key():
     """
     Get the API key for the current logged-in user.
@@ -775,23 +1028,149 @@ def get_current_user_api_key():
     return None
 
 
-def get_server_version():
+def get_request_config(server):
+    """Return this request's copy of the full config, loading it on first use.
+
+    load_config() deep-copies the whole config, so handlers and helpers serving the same
+    request share one copy via server._request_config. handle_default_request clears it
+    at the start of every request. Handlers may mutate the copy before saving it, exactly
+    as they would a fresh load_config() result.
+    """
+    request_config = getattr(server, '_request_config', None)
+    if request_config is None:
+        request_config = get_config_manager().load_config()
+        server._request_config = request_config
+    return request_config
+
+
+# Read-only "no CORS headers" value for error paths that cannot compute real ones
+NO_CORS_HEADERS = types.MappingProxyType({})
+
+
+def get_request_cors_headers(server):
+    """Return this request's CORS headers, computed once via server._get_cors_headers.
+
+    Cached on server._request_cors_headers, which handle_default_request clears with
+    _request_config. Callers that need to add headers must copy the dict first.
+    """
+    cors_headers = getattr(server, '_request_cors_headers', None)
+    if cors_headers is None:
+        request_headers = getattr(server, 'headers', None) or {}
+        requested_headers = request_headers.get('Access-Control-Request-Headers')
+        cors_headers = server._get_cors_headers(request_headers, requested_headers)
+        server._request_cors_headers = cors_headers
+    return cors_headers
+
+
+# Last version read by get_server_version(); only a config change can alter it (a migration
+# bump or an external edit), so it is dropped by a config-change callback. Failed reads are
+# not cached.
+_server_version_cache = None
+_server_version_callback_registered = False
+
+
+def forget_server_version(changed_config=None):
+    """Drop the cached server version (config-change callback)."""
+    global _server_version_cache
+    _server_version_cache = None
+
+
+def get_server_version(server=None):
     """
     Get the server version from nativemessaging.json.
     
+    Args:
+        server: Optional request-carrying server instance; when given, the version is read
+            from that request's shared config copy (see get_request_config)
+    
     Returns:
-        str: The version string (e.g., "1.0.8") or "1.0.0" if not found
+        str: The version string (e.g., "1.0.8") or "1.0.0" if not found; a successful
+            read is cached until the next config change
     """
+    global _server_version_cache, _server_version_callback_registered
+    server_version = _server_version_cache
+    if server_version is not None:
+        return server_version
     try:
-        from .shared_config import get_config_manager
         config_manager = get_config_manager()
-        config = config_manager.load_config()
-        return config.get("version", "1.0.0")
+        if not _server_version_callback_registered:
+            config_manager.register_config_change_callback(forget_server_version, wants_config=False)
+            _server_version_callback_registered = True
+        if server is not None:
+            config = get_request_config(server)
+        else:
+            config = config_manager.get_config_readonly()
+        server_version = config.get("version", "1.0.0")
+        _server_version_cache = server_version
+        return server_version
     except Exception as e:
         MCPLogger.log("Config", f"Error getting server version: {e}")
         return "1.0.0"
 
 
+# string.Template-compatible placeholders ($$ escape, $name, ${name}; identifiers matched
+# case-insensitively like Template.idpattern), compiled once and matched over bytes.
+_TEMPLATE_PLACEHOLDER_RE = re.compile(rb'\$(?:(\$)|([_a-z][_a-z0-9]*)|\{([_a-z][_a-z0-9]*)\})', re.IGNORECASE)
+
+
+def expand_template_bytes(template_bytes, template_vars):
+    """Expand $var/${var} placeholders in a bytes-like template (bytes, mmap, memoryview).
+
+    Same semantics as string.Template.safe_substitute(): '$$' becomes '$', unknown
+    variables and stray '$' are left unchanged. Values are str()ed and UTF-8 encoded.
+    Returns bytes.
+    """
+    encoded_vars = {name: str(value).encode('utf-8') for name, value in template_vars.items()}
+
+    def _substitute(match):
+        if match.group(1) is not None:
+            return b'$'
+        value = encoded_vars.get((match.group(2) or match.group(3)).decode('ascii'))
+        return match.group(0) if value is None else value
+
+    return _TEMPLATE_PLACEHOLDER_RE.sub(_substitute, template_bytes)
+
+
+# Text types served with "; charset=utf-8" appended
+UTF8_TEXT_CONTENT_TYPES = frozenset(('text/html', 'text/css', 'application/javascript', 'text/javascript', 'application/json', 'text/plain'))
+
+
+# Static file response cache: bounded entry count, and files above the size cap are never
+# cached so a few large assets cannot pin lots of memory.
+STATIC_FILE_CACHE_MAX_ENTRIES = 256
+STATIC_FILE_CACHE_MAX_FILE_BYTES = 1024 * 1024
+
+
+def _read_static_file(file_path, template_vars_items):
+    """Read a static file as bytes, expanding template placeholders when vars are given.
+
+    template_vars_items is a tuple of (name, value) pairs, or None to serve the file
+    verbatim. HTML templates are substituted straight over an mmap of the file: the page
+    cache is shared between requests and only the regions around placeholders get copied
+    into Python objects.
+    """
+    if template_vars_items is None:
+        # Unbuffered, so FileIO.readall() sizes one buffer from fstat() and the bytes
+        # are not staged through a BufferedReader.
+        with open(file_path, 'rb', buffering=0) as f:
+            return f.read()
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            content = b""  # mmap cannot map an empty file
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_template:
+                content = expand_template_bytes(mapped_template, dict(template_vars_items))
+    MCPLogger.log("StaticServer", f"Template expansion completed for {file_path}")
+    return content
+
+
+@functools.lru_cache(maxsize=STATIC_FILE_CACHE_MAX_ENTRIES)
+def _read_static_file_cached(file_path, mtime_ns, file_size, template_vars_items):
+    """LRU-cached _read_static_file(); mtime_ns/file_size only key the cache so edits miss."""
+    return _read_static_file(file_path, template_vars_items)
+
+
 def handle_static_request(server):
     """Handle requests to /pages/* and /scripts/* paths - simple static file server"""
     try:
@@ -816,7 +1195,6 @@ def handle_static_request(server):
             return "403 Forbidden", {"Content-Type": "text/plain"}, "Forbidden"
         
         # 3. Get bin folder from config manager
-        from .shared_config import get_config_manager
         config_manager = get_config_manager()
         bin_dir = config_manager._find_master_directory()
         
@@ -837,8 +1215,12 @@ def handle_static_request(server):
         except Exception:
             return "400 Bad Request", {"Content-Type": "text/plain"}, "Invalid path"
         
-        # Check if file exists
-        if not requested_file.exists() or not requested_file.is_file():
+        # Check if file exists - one stat() call, reused below for the file size
+        try:
+            file_stat = os.stat(requested_file)
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             MCPLogger.log("StaticServer", f"File not found: {requested_file}")
             return "404 Not Found", {"Content-Type": "text/plain"}, "File not found"
         
@@ -848,53 +1230,59 @@ def handle_static_request(server):
             content_type = "application/octet-stream"
         
         # Add charset=utf-8 for text-based content types
-        if content_type in ('text/html', 'text/css', 'application/javascript', 'text/javascript', 'application/json', 'text/plain'):
+        if content_type in UTF8_TEXT_CONTENT_TYPES:
             content_type = f"{content_type}; charset=utf-8"
         
-        # Read and serve the file
+        # Read and serve the file. Everything is served as the raw on-disk bytes: text files are
+        # UTF-8 on disk, so decoding them to str only for the server to re-encode was wasted work.
         try:
-            # For text files, read with UTF-8 encoding to properly handle emojis
-            if content_type.startswith('text/') or 'javascript' in content_type or 'json' in content_type:
-                with open(requested_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+            # For HTML files, expand template variables ($var / ${var}, string.Template syntax)
+            if content_type.startswith('text/html'):
+                # Build template variables
+                enable_https = getattr(server, 'enable_https', True)
+                protocol = "https" if enable_https else "http"
+                host = getattr(server, 'host', 'unknown')
+                port = getattr(server, 'port', 0)
+                server_url = f"{protocol}://{host}:{port}/"
+                username = getattr(server, 'authenticated_user', 'unknown')
+                version = get_server_version(server)
                 
-                # For HTML files, expand template variables using Python's string.Template
-                if content_type.startswith('text/html'):
-                    # Build template variables
-                    enable_https = getattr(server, 'enable_https', True)
-                    protocol = "https" if enable_https else "http"
-                    host = getattr(server, 'host', 'unknown')
-                    port = getattr(server, 'port', 0)
-                    server_url = f"{protocol}://{host}:{port}/"
-                    username = getattr(server, 'authenticated_user', 'unknown')
-                    version = get_server_version()
-                    
-                    template_vars = {
-                        'server_url': server_url,
-                        'current_user': username,
-                        'version': version,
-                        'host': host,
-                        'port': str(port),
-                        'protocol': protocol
-                    }
-                    
-                    # Use string.Template which uses $variable syntax (won't conflict with CSS/JS)
-                    # This is Python's standard library template system designed for this exact use case
-                    from string import Template
-                    try:
-                        template = Template(content)
-                        # safe_substitute() leaves unknown variables unchanged (e.g., $unknown stays as $unknown)
-                        content = template.safe_substitute(template_vars)
-                        MCPLogger.log("StaticServer", f"Template expansion completed for {requested_file}")
-                    except Exception as e:
-                        MCPLogger.log("StaticServer", f"Warning: Template expansion error in {requested_file}: {e}")
+                template_vars = {
+                    'server_url': server_url,
+                    'current_user': username,
+                    'version': version,
+                    'host': host,
+                    'port': str(port),
+                    'protocol': protocol
+                }
+                
+                template_vars_items = tuple(sorted(template_vars.items()))
             else:
-                # Binary files (images, etc.)
-                with open(requested_file, 'rb') as f:
-                    content = f.read()
+                template_vars_items = None  # served verbatim
+                
+                # Verbatim files get validators derived from the stat() above, so a browser
+                # revalidation is answered without opening the file at all
+                static_etag = f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+                validator_headers = {
+                    "Content-Type": content_type,
+                    "Cache-Control": "public, max-age=3600",
+                    "ETag": static_etag,
+                    "Last-Modified": email.utils.formatdate(file_stat.st_mtime, usegmt=True)
+                }
+                if request_etag_matches(getattr(server, 'headers', None) or {}, static_etag):
+                    return "304 Not Modified", validator_headers, b""
+            
+            # Small files come from an LRU keyed on (path, mtime, size, vars): repeat requests
+            # skip the open/read/substitute entirely, and editing the file changes the key.
+            if file_stat.st_size <= STATIC_FILE_CACHE_MAX_FILE_BYTES:
+                content = _read_static_file_cached(str(requested_file), file_stat.st_mtime_ns, file_stat.st_size, template_vars_items)
+            else:
+                content = _read_static_file(str(requested_file), template_vars_items)
             
             MCPLogger.log("StaticServer", f"Serving: {requested_file} ({len(content)} bytes, {content_type})")
             
+            if template_vars_items is None:
+                return "200 OK", validator_headers, content
             return "200 OK", {
                 "Content-Type": content_type,
                 #"Content-Length": str(len(content)), # done by server
@@ -910,6 +1298,12 @@ def handle_static_request(server):
         return "500 Internal Server Error", {"Content-Type": "text/plain"}, "Server error"
 
 
+# Fixed /_control response bodies (VERSION is a constant), pre-encoded once at import
+CONTROL_RESPONSE_HEADERS = {"Content-Type": "text/plain"}  # Content-Length is added by the server
+STOP_RESPONSE_BODY = b"Server stopping."
+RESTART_RESPONSE_BODY = f"Server restart in progress... (VERSION: {VERSION})".encode('utf-8')
+
+
 def refuse_unsafe_control_request(server, method):
     """Refuse a /_control request unless it is a POST on an auth-protected server.
 
@@ -936,15 +1330,22 @@ def handle_stop_request(server, method, headers, body):
     # Log stop request with connection sequence number
     MCPLogger.log("Control Request", "Stop server command received")
     
-    # Start shutdown in a separate thread so we can return response
-    threading.Thread(target=lambda: (
-        time.sleep(0.1),  # Brief delay to allow response to be sent
-        server.initiate_graceful_server_shutdown()
-    )).start()
+    # Shut down once the response has been written, via the same after-response hook that
+    # handle_restart_request uses (no extra thread, no sleep racing the response flush)
+    server.after_response_handler = server.initiate_graceful_server_shutdown
     
-    return "200 OK", {
-        "Content-Type": "text/plain"
-    }, "Server stopping."
+    return "200 OK", dict(CONTROL_RESPONSE_HEADERS), STOP_RESPONSE_BODY
+
+@functools.lru_cache(maxsize=1)
+def get_restart_command():
+    """Return (executable, absolute script path, args tuple) used to chain a restart.
+
+    Computed once and reused: none of it changes during the process lifetime. Resolved on
+    first use rather than at import, because friday.py installs the simulated sys.argv
+    (review C6) after importing this module; the 'restart' command itself is dropped.
+    """
+    return sys.executable, os.path.abspath(sys.argv[0]), tuple(a for a in sys.argv[1:] if a != 'restart')
+
 
 def platform_specific_chain(executable, script_path, args):
     """
@@ -959,7 +1360,7 @@ def platform_specific_chain(executable, script_path, args):
         None - this function should not return on success
         
     On Windows: spawns a fresh process via subprocess.Popen, then exits.
-    On Unix-like: Uses fork() + execv() to ensure new PID
+    On Unix-like: Uses posix_spawn() (fork() + execv() fallback) to ensure new PID
     """
     cmd = [executable, script_path] + args
     MCPLogger.log("Restart", f"Command: {' '.join(cmd)}")
@@ -1002,7 +1403,20 @@ def platform_specific_chain(executable, script_path, args):
                 # Last resort: just exit and let the user restart manually
                 os._exit(1)
     else:
-        # On Unix-like systems, fork then exec to get new PID
+        # On Unix-like systems, start the replacement with posix_spawn: a new PID without
+        # duplicating this (possibly large) process's page tables the way fork() does, and
+        # no copy-on-write double-heap peak on hosts with overcommit disabled. Our sockets
+        # are non-inheritable (PEP 446), so the child does not keep the port bound.
+        posix_spawn = getattr(os, 'posix_spawn', None)
+        if posix_spawn is not None:
+            try:
+                pid = posix_spawn(executable, cmd, os.environ)
+                MCPLogger.log("Parent", f"Spawned child PID {pid}, parent exiting")
+                os._exit(0)  # Parent exits immediately
+            except OSError as spawn_exception:
+                MCPLogger.log("Restart", f"posix_spawn failed ({spawn_exception}), falling back to fork()+execv()")
+        
+        # Fallback: fork then exec to get new PID
         try:
             pid = os.fork()
             if pid == 0:  # Child process
@@ -1031,45 +1445,29 @@ def handle_restart_request(server, method, headers, body):
     MCPLogger.log("Control Request", "Restart server command received")
     
     # Get current process args to chain to new instance
-    executable = sys.executable
-    script_path = os.path.abspath(sys.argv[0])  # Use absolute path
-    args = sys.argv[1:]
-    
-    # Filter out 'restart' command if it exists
-    if 'restart' in args:
-        args.remove('restart')
+    executable, script_path, args = get_restart_command()
+    command_text = f"{executable} {script_path} {' '.join(args)}"
     
     # Log what we're about to do
-    MCPLogger.log("Restart Command", f"{executable} {script_path} {' '.join(args)}")
+    MCPLogger.log("Restart Command", command_text)
     
     # Schedule the after-response handler
     def chain_after_response():
-        # Get command details again
-        executable = sys.executable
-        script_path = os.path.abspath(sys.argv[0])
-        args = [a for a in sys.argv[1:] if a != 'restart']
-        
         # Close all connections and socket
         server.initiate_graceful_server_shutdown()
         
         # Log that we're about to chain
-        MCPLogger.log("Server", f"Transferring control to: {executable} {script_path} {' '.join(args)}")
+        MCPLogger.log("Server", f"Transferring control to: {command_text}")
         
         # Use platform-specific chaining
-        platform_specific_chain(executable, script_path, args)
+        platform_specific_chain(executable, script_path, list(args))
     
     # Register the after-response handler
     server.after_response_handler = chain_after_response
     
     # First send success response to client
-    response = f"Server restart in progress... (VERSION: {VERSION})"
-    headers = {
-        "Content-Type": "text/plain"
-        #"Content-Length": str(len(response)) # done by server
-    }
-    
     # Return response - this must complete before we chain
-    return "200 OK", headers, response
+    return "200 OK", dict(CONTROL_RESPONSE_HEADERS), RESTART_RESPONSE_BODY
 
 def touch_file(filepath):
     """Update the access and modification times of a file to current time.
@@ -1114,26 +1512,22 @@ def check_global_auth(server_instance):
     if path == '/favicon.ico':
         return True, None
     
-    # Extract authentication data from server instance
-    auth_header = getattr(server_instance, 'headers', {}).get('Authorization') or getattr(server_instance, 'headers', {}).get('authorization')
+    # OAuth discovery/endpoints are answered 404 whenever OAuth is disabled, whatever the
+    # credentials, so decide that before parsing any auth data
+    is_oauth_path = path in OAUTH_DISCOVERY_PATHS or path.startswith('/oauth2/')
+    if is_oauth_path and not is_oauth_enabled():
+        return False, not_found_response()
+    
+    # Extract authentication data from server instance (headers looked up once, below too)
+    request_headers = getattr(server_instance, 'headers', None) or {}
+    auth_header = get_request_header(request_headers, 'Authorization')
     client_address = getattr(server_instance, 'current_client_address', None)
     
     # Extract URL parameters for authentication
-    url_user = None
-    url_api_key = None
-    if hasattr(server_instance, 'query_params'):
-        # Get user parameter (check both 'user' and 'username')
-        user_params = server_instance.query_params.get('user', []) + server_instance.query_params.get('username', [])
-        if user_params:
-            url_user = user_params[0]
-        
-        # Get API key parameter
-        api_key_params = server_instance.query_params.get('RAGTAG_API_KEY', [])
-        if api_key_params:
-            url_api_key = api_key_params[0]
+    url_user, url_api_key = get_url_auth_params(server_instance)
     
     # Get host header for hostname-based UUID authentication
-    host_header = getattr(server_instance, 'headers', {}).get('host') or getattr(server_instance, 'headers', {}).get('Host')
+    host_header = get_request_header(request_headers, 'Host')
     
     # Validate authentication
     is_valid, username = validate_auth(auth_header, url_user, url_api_key, client_address, host_header)
@@ -1141,22 +1535,17 @@ def check_global_auth(server_instance):
     # Allow OAuth discovery endpoint and oauth calls without auth (required for OAuth flow)
     # But only if OAuth is enabled in config. Uses the same canonical path set that
     # handle_default_request serves, so no allowed-but-unserved variant exists (review A1).
-    if path in OAUTH_DISCOVERY_PATHS or path.startswith('/oauth2/'):
+    if is_oauth_path:
         if is_valid:
             oauth_enabled = False # Hide the fact we can do OAuth when it's not needed; so this works:-
             # codex mcp add --url https://9e3c0795-4733-4f54-b134-643918bd4621-127-0-0-1.local.aurafriday.com:31173/sse rog
         else:
-            # Check if OAuth is enabled in config
-            from .shared_config import get_config_manager
-            config_manager = get_config_manager()
-            config = config_manager.load_config()
-            oauth_config = config.get("settings", [{}])[0].get("oauth", {})
-            oauth_enabled = oauth_config.get("enabled", False)
+            oauth_enabled = True  # checked before auth parsing above
 
         #return True, None
         if not oauth_enabled: # disabled, or, Hide the fact we can do OAuth when it's not needed; so this works:-
             # codex mcp add --url https://9e3c0795-4733-4f54-b134-643918bd4621-127-0-0-1.local.aurafriday.com:31173/sse rog
-            return False, ("404 Not Found", { "Content-Type": "text/plain; charset=utf-8", "Cache-Control": "no-store" }, "Not Found")
+            return False, not_found_response()
         else:
             # OAuth flow is allowed unauthenticated, but this request has NOT authenticated a
             # user. Mark it so the default handler refuses to fall through to the homepage
@@ -1166,12 +1555,7 @@ def check_global_auth(server_instance):
 
     if not is_valid:
         # Return 401 Unauthorized response
-        error_response = ("401 Unauthorized", {
-            "WWW-Authenticate": 'Basic realm="Aura Friday mcp-link server"',
-            "Content-Type": "text/plain; charset=utf-8",
-            "Cache-Control": "no-store"
-        }, "Access Denied")
-        return False, error_response
+        return False, unauthorized_response()
     
     # Store authenticated username in server instance for later use
     server_instance.authenticated_user = username
@@ -1209,9 +1593,10 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
     elif auth_header and auth_header.startswith('Basic '):
         try:
             # Extract credentials from Basic auth header
-            credentials = auth_header[6:]  # Remove "Basic " prefix
-            decoded_credentials = base64.b64decode(credentials).decode('utf-8')
-            username, password = decoded_credentials.split(':', 1)
+            parsed_credentials = parse_basic_credentials(auth_header[6:])  # Remove "Basic " prefix
+            if parsed_credentials is None:
+                raise ValueError("malformed Basic credentials")
+            username, password = parsed_credentials
             auth_method = "Basic Auth"
             
             # If username is empty, treat as no auth and fall through to hostname UUID
@@ -1233,24 +1618,16 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
             username = None
             password = token
             
-            # Check OAuth access tokens first
+            # Check OAuth access tokens first (cached per token, see resolve_oauth_access_token)
             try:
-                from .shared_config import get_config_manager, SharedConfigManager
-                config_manager = get_config_manager()
-                full_config = config_manager.load_config()
-                oauth_data = SharedConfigManager.ensure_settings_section(full_config, 'oauth')
+                oauth_client_name, oauth_expires_at = resolve_oauth_access_token(token)
                 
-                if token in oauth_data.get('access_tokens', {}):
-                    token_data = oauth_data['access_tokens'][token]
-                    
+                if oauth_expires_at is not None:
                     # Check if token is expired
-                    import time
-                    if token_data['expires_at'] > time.time():
-                        # Valid OAuth token - get client info
-                        client_id = token_data['client_id']
-                        if client_id in oauth_data.get('clients', {}):
-                            client_info = oauth_data['clients'][client_id]
-                            username = client_info.get('client_name', client_id)
+                    if oauth_expires_at > time.time():
+                        # Valid OAuth token - only honored while its client still exists
+                        if oauth_client_name is not None:
+                            username = oauth_client_name
                             password = token
                             auth_method = "Bearer OAuth"
                             MCPLogger.log("Auth", f"Attempting {auth_method} for OAuth client: {username} from {client_ip}")
@@ -1261,22 +1638,19 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
                 MCPLogger.log("Auth", f"Error checking OAuth tokens: {e}")
                 # Continue to check regular authorized users
             
-            # If not found in OAuth tokens, check authorized users API keys
-            # (constant-time comparison so the lookup cannot leak key prefixes via timing, review D6)
+            # If not found in OAuth tokens, check authorized users API keys via the reverse
+            # index; the key itself is re-verified in constant time below (review D6)
             if not username:
-                for user, user_config in AUTHORIZED_USERS.items():
-                    if api_key_matches_constant_time(token, user_config.get('api_key')):
-                        username = user
-                        break
+                username = find_user_by_api_key(token)
                 
                 auth_method = "Bearer Auth"
                 if not username:
                     # Try to decode as base64 in case it's a Basic auth token in Bearer format
-                    try:
-                        decoded_credentials = base64.b64decode(token).decode('utf-8')
-                        username, password = decoded_credentials.split(':', 1)
+                    parsed_credentials = parse_basic_credentials(token)
+                    if parsed_credentials is not None:
+                        username, password = parsed_credentials
                         auth_method = "Bearer Basic Auth"
-                    except Exception:
+                    else:
                         # Not base64 encoded - just a plain token that doesn't match any user.
                         # Mask the offered token: it may be a typo'd real key and this log is
                         # world-shared (review B3).
@@ -1298,8 +1672,7 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
         if host_header:
             try:
                 # Look for UUID pattern at start of hostname: {uuid}-{rest-of-domain}
-                uuid_pattern = r'^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-(.+)$'
-                match = re.match(uuid_pattern, host_header, re.IGNORECASE)
+                match = UUID_HOST_RE.match(host_header)
                 
                 if match:
                     extracted_uuid = match.group(1)
@@ -1309,15 +1682,13 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
                     # credential must not land in the world-shared logfile (review B3).
                     MCPLogger.log("Auth", f"Found UUID '{mask_secret_for_logging(extracted_uuid)}' in hostname '...-{original_domain}' from {client_ip}")
                     
-                    # Search through all authorized users to find a matching API key (same as Bearer
-                    # auth; constant-time comparison, review D6)
-                    for user, user_config in AUTHORIZED_USERS.items():
-                        if api_key_matches_constant_time(extracted_uuid, user_config.get('api_key')):
-                            username = user
-                            password = extracted_uuid
-                            auth_method = "Hostname UUID"
-                            MCPLogger.log("Auth", f"Attempting {auth_method} for user: {username} from {client_ip}")
-                            break
+                    # Find the user owning this API key (same reverse index as Bearer auth; the
+                    # key is re-verified in constant time below, review D6)
+                    username = find_user_by_api_key(extracted_uuid)
+                    if username:
+                        password = extracted_uuid
+                        auth_method = "Hostname UUID"
+                        MCPLogger.log("Auth", f"Attempting {auth_method} for user: {username} from {client_ip}")
                     
                     # If no match found, fail with clear message (masked - review B3)
                     if not username:
@@ -1349,21 +1720,20 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
             return True, username
         
         # Check if user exists in authorized_users (for non-OAuth auth methods)
-        if username in AUTHORIZED_USERS:
-            user_config = AUTHORIZED_USERS[username]
-            expected_api_key = user_config.get('api_key')
-            #MCPLogger.log("Auth", f"Expected API key for '{username}': '{expected_api_key[:8]}...'")
+        user_record = get_authorized_user_record(username)
+        if user_record is not None:
+            #MCPLogger.log("Auth", f"Expected API key for '{username}': '{user_record.api_key[:8]}...'")
             
             # Check if the password matches the user's API key.
             # Constant-time comparison to avoid leaking the key via timing (review D6).
-            if api_key_matches_constant_time(password, expected_api_key):
+            if api_key_matches_constant_time(password, user_record.api_key):
                 MCPLogger.log("Auth", f"{GRN}Successful {auth_method} authentication for user: {username} from {client_ip}{NORM}")
                 return True, username
             else:
                 # Do NOT log the offered key value - it lands in the world-shared logfile (review B3).
                 MCPLogger.log("Auth", f"{YEL}Password/API key mismatch for user '{username}' via {auth_method} from {client_ip}{NORM}")
         else:
-            MCPLogger.log("Auth", f"{YEL}User '{username}' not found in authorized users via {auth_method} from {client_ip}. Available users: {list(AUTHORIZED_USERS.keys())}{NORM}")
+            MCPLogger.log("Auth", f"{YEL}User '{username}' not found in authorized users via {auth_method} from {client_ip} ({len(AUTHORIZED_USERS)} users configured){NORM}")
         
         MCPLogger.log("Auth", f"{YEL}Failed {auth_method} authentication attempt for user: {username} from {client_ip}{NORM}")
         return False, username
@@ -1372,18 +1742,139 @@ def validate_auth(auth_header=None, url_user=None, url_api_key=None, client_addr
         MCPLogger.log("Auth", f"{YEL}Error validating auth from {client_ip}: {e}{NORM}")
         return False, None
 
+def _json_dumps_bytes(payload, indent=None):
+    """Serialize payload to UTF-8 JSON bytes: compact by default, pretty with indent.
+
+    Uses orjson when it is installed (several times faster than the stdlib encoder on
+    config-sized dicts), otherwise json.dumps with compact separators. Anything orjson
+    refuses to encode (e.g. ints beyond 64 bits) also goes through json.dumps.
+    """
+    if orjson is not None and indent in (None, 2):
+        options = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            options |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(payload, option=options)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    if indent is None:
+        return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return json.dumps(payload, indent=indent).encode('utf-8')
+
+
+# settings[0] keys the Settings API refuses to modify (add more as needed)
+PROTECTED_SETTINGS_KEYS = frozenset(('_internal',))
+
+# Upper bound, in UTF-8 bytes, on a PUT /api/settings/{key} body; settings values are
+# small JSON documents
+MAX_SETTINGS_BODY_LENGTH = 64 * 1024
+
+
+def _utf8_length(body):
+    """Length of a request body in UTF-8 bytes (body is the decoded str, or bytes)."""
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return len(body)
+
+
+# A run of 19+ digits may be an integer literal outside 64 bits (-2**63 - 1 has 19 digits)
+_LONG_DIGIT_RUN_RE = re.compile(r'[0-9]{19,}')
+_LONG_DIGIT_RUN_BYTES_RE = re.compile(rb'[0-9]{19,}')
+
+
+def _json_loads(body):
+    """Parse a JSON request body (str or bytes), via orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers keep catching
+    the stdlib exception either way. orjson decodes integers beyond 64 bits to a lossy
+    float instead of failing, and settings bodies get saved, so a body holding a long
+    digit run is parsed by json.loads, which keeps such integers exact.
+    """
+    if orjson is not None:
+        long_digit_run_re = _LONG_DIGIT_RUN_BYTES_RE if isinstance(body, (bytes, bytearray)) else _LONG_DIGIT_RUN_RE
+        if long_digit_run_re.search(body) is None:
+            return orjson.loads(body)
+    return json.loads(body)
+
+
 def _json_response(status, payload, cors_headers=None, extra_headers=None, indent=None):
     """Build a (status, headers, body) JSON response tuple (review D3).
 
     Centralizes the Content-Type + optional CORS/extra header merge that the Settings,
     Users, Status and Tools API handlers previously repeated at every return site.
+    The body is returned as UTF-8 bytes (see _json_dumps_bytes).
     """
     headers = {"Content-Type": "application/json"}
     if extra_headers:
         headers.update(extra_headers)
     if cors_headers:
         headers.update(cors_headers)
-    return status, headers, json.dumps(payload, indent=indent)
+    return status, headers, _json_dumps_bytes(payload, indent=indent)
+
+
+# /api/settings or /api/settings/{key}; group 1 is the (possibly empty) key
+SETTINGS_API_PATH_RE = re.compile(r'^/api/settings(?:/([A-Za-z0-9_.]*))?$')
+
+
+def _settings_get_all(full_config):
+    """GET /api/settings: the entire settings[0] object (created if missing)."""
+    if "settings" not in full_config or not isinstance(full_config["settings"], list):
+        MCPLogger.log("Settings API", f"Warning: settings array missing, creating empty structure")
+        full_config["settings"] = [{}]
+    if not full_config["settings"]:
+        MCPLogger.log("Settings API", f"Warning: settings array empty, creating empty object")
+        full_config["settings"] = [{}]
+    response_data = full_config["settings"][0]
+    MCPLogger.log("Settings API", f"Returning entire settings[0] ({len(response_data)} keys)")
+    return response_data
+
+
+def _settings_get_configs(full_config):
+    """GET /api/settings/configs: the extension-compatible { settings: { value: [...] } } structure."""
+    if "settings" not in full_config or not isinstance(full_config["settings"], list):
+        MCPLogger.log("Settings API", f"Warning: settings array missing, creating empty structure")
+        full_config["settings"] = [{}]
+    
+    response_data = {
+        "settings": {
+            "value": full_config["settings"]
+        }
+    }
+    MCPLogger.log("Settings API", f"Returning configs structure with {len(full_config['settings'])} settings sections")
+    return response_data
+
+
+def _settings_get_nested(full_config, actual_key):
+    """GET /api/settings/settings.X: the dot-notation value settings[0].X, or None."""
+    response_data = SharedConfigManager.get_settings_value(full_config, actual_key, default=None)
+    
+    if response_data is not None:
+        MCPLogger.log("Settings API", f"Found nested key 'settings.{actual_key}' -> settings[0]['{actual_key}']")
+    else:
+        MCPLogger.log("Settings API", f"Nested key 'settings.{actual_key}' not found in settings[0], returning null")
+    return response_data
+
+
+_SETTINGS_KEY_NOT_FOUND = object()
+
+
+def _settings_get_key(full_config, settings_key):
+    """GET /api/settings/{key}: settings[0] value by dot-notation key, created as {} if missing."""
+    response_data = SharedConfigManager.get_settings_value(full_config, settings_key, default=_SETTINGS_KEY_NOT_FOUND)
+    
+    if response_data is _SETTINGS_KEY_NOT_FOUND:
+        # Key doesn't exist - create it as empty dict using ensure_settings_section
+        MCPLogger.log("Settings API", f"Key '{settings_key}' not found in settings[0], creating empty object")
+        response_data = SharedConfigManager.ensure_settings_section(full_config, settings_key)
+    else:
+        MCPLogger.log("Settings API", f"Found existing key '{settings_key}' in settings[0]")
+    return response_data
+
+
+# Settings keys with a special GET meaning, matched exactly before the generic lookup
+SETTINGS_GET_SPECIAL_KEY_HANDLERS = {
+    "configs": _settings_get_configs,
+}
 
 
 def handle_settings_api_request(server):
@@ -1453,29 +1944,24 @@ def handle_settings_api_request(server):
         client_ip = f"{client_address[0]}:{client_address[1]}" if client_address else "unknown"
         
         # Get CORS headers using server's standardized method
-        request_headers = getattr(server, 'headers', {})
-        requested_headers = request_headers.get('Access-Control-Request-Headers')
-        cors_headers = server._get_cors_headers(request_headers, requested_headers)
+        cors_headers = get_request_cors_headers(server)
         
         # Handle OPTIONS preflight requests
         if method == "OPTIONS":
             MCPLogger.log("Settings API", f"OPTIONS preflight request from {client_ip}")
-            return "204 No Content", cors_headers, ""
+            return "204 No Content", dict(cors_headers), ""
         
-        # Parse the path to extract the key (if any)
-        path_parts = path.split('/')  # ['', 'api', 'settings', 'key'] or ['', 'api', 'settings']
-        settings_key = None
-        if len(path_parts) > 3 and path_parts[3]:
-            settings_key = path_parts[3]
-            # Validate key name (alphanumeric + underscore + period only)
-            if not settings_key.replace('_', '').replace('.', '').isalnum():
-                return _json_response("400 Bad Request", {"error": f"Invalid key name. Only alphanumeric characters, underscores, and periods allowed:{path_parts[3]}"}, cors_headers=cors_headers)
+        # Parse and validate the key (if any) in one match: /api/settings[/{key}], where the
+        # key is alphanumeric + underscore + period only and exactly one path segment
+        path_match = SETTINGS_API_PATH_RE.match(path)
+        if path_match is None:
+            return _json_response("400 Bad Request", {"error": f"Invalid key name. Only alphanumeric characters, underscores, and periods allowed:{path[len('/api/settings/'):]}"}, cors_headers=cors_headers)
+        settings_key = path_match.group(1) or None
         
         # Load config and check permissions
-        from .shared_config import SharedConfigManager, get_config_manager
         
         config_manager = get_config_manager()
-        full_config = config_manager.load_config()
+        full_config = get_request_config(server)
         
         MCPLogger.log("Settings API", f"Loaded config with {len(full_config.get('settings', []))} settings sections")
         
@@ -1487,7 +1973,7 @@ def handle_settings_api_request(server):
         user_info = authorized_users.get(username)
         if not user_info:
             MCPLogger.log("Settings API", f"ERROR: User {username} not found in authorized_users from {client_ip}")
-            MCPLogger.log("Settings API", f"Available users: {list(authorized_users.keys())}")
+            MCPLogger.log("Settings API", f"Configured users: {len(authorized_users)}")
             return _json_response("403 Forbidden", {"error": "User not found in authorized users"}, cors_headers=cors_headers)
         
         user_permissions = user_info.get('permissions', [])
@@ -1501,60 +1987,25 @@ def handle_settings_api_request(server):
         
         MCPLogger.log("Settings API", f"User {username} authorized for {method} {path}")
         
-        # Handle GET requests
+        # Handle GET requests: one dict lookup for exact special keys, one prefix check for
+        # "settings.X", otherwise a plain settings[0] key
         if method == "GET":
-            if settings_key:
-                # Special case: 'configs' key returns the extension-compatible structure
-                if settings_key == "configs":
-                    # Return the structure expected by the extension JavaScript:
-                    # { settings: { value: [...] } }
-                    if "settings" not in full_config or not isinstance(full_config["settings"], list):
-                        MCPLogger.log("Settings API", f"Warning: settings array missing, creating empty structure")
-                        full_config["settings"] = [{}]
-                    
-                    response_data = {
-                        "settings": {
-                            "value": full_config["settings"]
-                        }
-                    }
-                    MCPLogger.log("Settings API", f"Returning configs structure with {len(full_config['settings'])} settings sections")
-                # Special case: 'settings.X' key is trying to access a nested setting value
+            if not settings_key:
+                response_data = _settings_get_all(full_config)
+            else:
+                special_key_handler = SETTINGS_GET_SPECIAL_KEY_HANDLERS.get(settings_key)
+                if special_key_handler is not None:
+                    response_data = special_key_handler(full_config)
                 elif settings_key.startswith("settings."):
-                    # Extract the actual setting name after "settings."
-                    actual_key = settings_key[9:]  # Remove "settings." prefix
-                    
-                    # Use get_settings_value to handle dot-notation
-                    response_data = SharedConfigManager.get_settings_value(full_config, actual_key, default=None)
-                    
-                    if response_data is not None:
-                        MCPLogger.log("Settings API", f"Found nested key 'settings.{actual_key}' -> settings[0]['{actual_key}']")
-                    else:
-                        MCPLogger.log("Settings API", f"Nested key 'settings.{actual_key}' not found in settings[0], returning null")
+                    response_data = _settings_get_nested(full_config, settings_key[9:])  # Remove "settings." prefix
                 else:
-                    # Use get_settings_value to handle dot-notation (e.g., "server.port")
-                    # Try to get the value first
-                    response_data = SharedConfigManager.get_settings_value(full_config, settings_key, default="__NOT_FOUND__")
-                    
-                    if response_data == "__NOT_FOUND__":
-                        # Key doesn't exist - create it as empty dict using ensure_settings_section
-                        MCPLogger.log("Settings API", f"Key '{settings_key}' not found in settings[0], creating empty object")
-                        key_value = SharedConfigManager.ensure_settings_section(full_config, settings_key)
-                        response_data = key_value
-                    else:
-                        MCPLogger.log("Settings API", f"Found existing key '{settings_key}' in settings[0]")
-            else:
-                # Get entire settings[0] object
-                if "settings" not in full_config or not isinstance(full_config["settings"], list):
-                    MCPLogger.log("Settings API", f"Warning: settings array missing, creating empty structure")
-                    full_config["settings"] = [{}]
-                if not full_config["settings"]:
-                    MCPLogger.log("Settings API", f"Warning: settings array empty, creating empty object")
-                    full_config["settings"] = [{}]
-                response_data = full_config["settings"][0]
-                MCPLogger.log("Settings API", f"Returning entire settings[0] with keys: {list(response_data.keys())}")
+                    response_data = _settings_get_key(full_config, settings_key)
             
-            MCPLogger.log("Settings API", f"GET {path} -> {len(json.dumps(response_data))} bytes")
-            return _json_response("200 OK", response_data, cors_headers=cors_headers, indent=2)
+            # Compact on the wire; ?pretty=1 keeps the indented form for debugging by hand
+            pretty_params = (getattr(server, 'query_params', None) or {}).get('pretty', [])
+            response = _json_response("200 OK", response_data, cors_headers=cors_headers, indent=2 if pretty_params and pretty_params[0] == '1' else None)
+            MCPLogger.log("Settings API", f"GET {path} -> {len(response[2])} bytes")
+            return response
         
         # Handle PUT requests
         elif method == "PUT":
@@ -1563,21 +2014,27 @@ def handle_settings_api_request(server):
                 return _json_response("400 Bad Request", {"error": "PUT requires a settings key. Use: PUT /api/settings/{key}"}, cors_headers=cors_headers)
             
             # Block modification of protected keys
-            protected_keys = ['_internal']  # Add more as needed
-            if settings_key in protected_keys:
+            if settings_key in PROTECTED_SETTINGS_KEYS:
                 MCPLogger.log("Settings API", f"ERROR: Attempt to modify protected key '{settings_key}' from {client_ip}")
                 return _json_response("403 Forbidden", {"error": f"Key \"{settings_key}\" is protected and cannot be modified"}, cors_headers=cors_headers)
             
             # Get request body
             body = getattr(server, 'oauth_body', '')  # Body is stored in oauth_body by server.py
             
-            # Parse JSON body
-            if not body.strip():
+            # Reject oversized bodies before scanning or parsing them. A str body is measured
+            # in UTF-8 bytes; one with more characters than the limit is too large either way
+            body_length = len(body) if len(body) > MAX_SETTINGS_BODY_LENGTH else _utf8_length(body)
+            if body_length > MAX_SETTINGS_BODY_LENGTH:
+                MCPLogger.log("Settings API", f"ERROR: PUT body too large ({body_length} bytes) from {client_ip}")
+                return _json_response("413 Payload Too Large", {"error": f"Request body exceeds {MAX_SETTINGS_BODY_LENGTH} bytes"}, cors_headers=cors_headers)
+            
+            # Parse JSON body (isspace() checks in place, where strip() would copy the body)
+            if not body or body.isspace():
                 MCPLogger.log("Settings API", f"ERROR: Empty body in PUT request from {client_ip}")
                 return _json_response("400 Bad Request", {"error": "Empty request body. JSON value required."}, cors_headers=cors_headers)
             
             try:
-                new_value = json.loads(body)
+                new_value = _json_loads(body)
             except json.JSONDecodeError as e:
                 MCPLogger.log("Settings API", f"ERROR: Invalid JSON in PUT request from {client_ip}: {e}")
                 return _json_response("400 Bad Request", {"error": f"Invalid JSON: {str(e)}"}, cors_headers=cors_headers)
@@ -1594,20 +2051,14 @@ def handle_settings_api_request(server):
                 # Use set_settings_value to handle dot-notation in the id (e.g., "server.port")
                 SharedConfigManager.set_settings_value(full_config, actual_setting_id, actual_setting_value)
                 
-                # Log what was actually set (show nested path for dot-notation)
-                if '.' in actual_setting_id:
-                    keys = actual_setting_id.split('.')
-                    nested_path = "settings[0]"
-                    for key in keys:
-                        nested_path += f"['{key}']"
-                    MCPLogger.log("Settings API", f"Set {nested_path} = {actual_setting_value}")
-                else:
-                    MCPLogger.log("Settings API", f"Set settings[0]['{actual_setting_id}'] = {actual_setting_value}")
+                # Log what was actually set (dot-notation ids show as the nested path)
+                nested_path = "settings[0]['" + "']['".join(actual_setting_id.split('.')) + "']"
+                MCPLogger.log("Settings API", f"Set {nested_path} ({type(actual_setting_value).__name__})")
             else:
                 # Normal case: directly set the key to the value
                 # Use set_settings_value to handle dot-notation (e.g., "server.port")
                 SharedConfigManager.set_settings_value(full_config, settings_key, new_value)
-                MCPLogger.log("Settings API", f"Updated settings[0]['{settings_key}'] = {new_value}")
+                MCPLogger.log("Settings API", f"Updated settings[0]['{settings_key}'] ({type(new_value).__name__})")
             
             # Save the updated config
             success = config_manager.save_config(full_config)
@@ -1625,20 +2076,22 @@ def handle_settings_api_request(server):
             return _json_response("405 Method Not Allowed", {"error": "Only GET and PUT methods are supported"}, cors_headers=cors_headers, extra_headers={"Allow": "GET, PUT"})
             
     except Exception as e:
-        MCPLogger.log("Settings API", f"ERROR: Exception in handler: {e}")
-        import traceback
-        MCPLogger.log("Settings API", f"ERROR: Traceback:\n{traceback.format_exc()}")
-        # CORS headers even for errors - get from server if available
-        try:
-            request_headers = getattr(server, 'headers', {})
-            requested_headers = request_headers.get('Access-Control-Request-Headers')
-            cors_headers = server._get_cors_headers(request_headers, requested_headers)
-        except:
-            # If we cannot compute proper CORS headers, send NONE rather than a permissive
-            # "Access-Control-Allow-Origin: null" + credentials, which any sandboxed iframe /
-            # file:// origin would match (review B2). An error body simply won't be readable
-            # cross-origin, which is the safe outcome.
-            cors_headers = {}
+        log_exception("Settings API", f"ERROR: Exception in handler: {e}")
+        # CORS headers even for errors: normally already computed for this request, in
+        # which case no guarded call is needed. If we cannot compute proper CORS headers,
+        # send NONE rather than a permissive "Access-Control-Allow-Origin: null" +
+        # credentials, which any sandboxed iframe / file:// origin would match (review B2).
+        # An error body simply won't be readable cross-origin, which is the safe outcome.
+        cors_headers = getattr(server, '_request_cors_headers', None)
+        if cors_headers is None:
+            if getattr(server, '_get_cors_headers', None) is None:
+                cors_headers = NO_CORS_HEADERS
+            else:
+                try:
+                    cors_headers = get_request_cors_headers(server)
+                except Exception:
+                    # The failure being reported may be this very computation
+                    cors_headers = NO_CORS_HEADERS
         return _json_response("500 Internal Server Error", {"error": "Internal server error", "details": str(e)}, cors_headers=cors_headers)
 
 
@@ -1657,6 +2110,48 @@ def handle_settings_request(server):
     }, "Redirecting to /pages/popover.html"
 
 
+# One OAuth2Handler shared across requests. Construction runs _ensure_oauth_structure (a
+# full config load), so the instance is only rebuilt after a config change, which is also
+# when an external edit could have removed the oauth subsections it relies on.
+_OAUTH2_HANDLER = None
+_OAUTH2_HANDLER_LOCK = threading.Lock()
+
+
+def drop_oauth2_handler(changed_config=None):
+    """Forget the shared OAuth2Handler so the next request rebuilds it (config-change callback)."""
+    global _OAUTH2_HANDLER
+    with _OAUTH2_HANDLER_LOCK:
+        _OAUTH2_HANDLER = None
+
+
+def get_oauth2_handler():
+    """Return the shared OAuth2Handler, constructing it on first use after a config change."""
+    global _OAUTH2_HANDLER
+    with _OAUTH2_HANDLER_LOCK:
+        if _OAUTH2_HANDLER is None:
+            config_manager = get_config_manager()
+            config_manager.register_config_change_callback(drop_oauth2_handler, wants_config=False)  # no-op if already registered
+            _OAUTH2_HANDLER = OAuth2Handler(config_manager)
+        return _OAUTH2_HANDLER
+
+
+# (path, method) -> call into the shared OAuth2Handler with (body, headers, query_params)
+OAUTH2_ENDPOINT_HANDLERS = {
+    # Dynamic Client Registration
+    ("/oauth2/register", "POST"): lambda handler, body, headers, query_params: handler.handle_client_registration(body),
+    # Authorization endpoint - show consent page
+    ("/oauth2/authorize", "GET"): lambda handler, body, headers, query_params: handler.handle_authorization_request(query_params),
+    # User approved/denied authorization
+    ("/oauth2/authorize_approve", "POST"): lambda handler, body, headers, query_params: handler.handle_authorization_approval(body),
+    # Token endpoint - exchange code for tokens or refresh
+    ("/oauth2/token", "POST"): lambda handler, body, headers, query_params: handler.handle_token_request(body, headers),
+    # Token introspection
+    ("/oauth2/introspect", "POST"): lambda handler, body, headers, query_params: handler.handle_introspection_request(body),
+    # Token revocation
+    ("/oauth2/revoke", "POST"): lambda handler, body, headers, query_params: handler.handle_revocation_request(body),
+}
+
+
 def handle_oauth2_request(server):
     """
     Handle OAuth 2.0 endpoint requests
@@ -1664,12 +2159,11 @@ def handle_oauth2_request(server):
     Routes requests to appropriate OAuth2Handler methods based on path.
     This is called from handle_default_request when path starts with /oauth2/
     """
-    from .shared_config import get_config_manager
-    from .oauth2_handler import OAuth2Handler
-    
-    # Initialize OAuth handler
-    config_manager = get_config_manager()
-    oauth_handler = OAuth2Handler(config_manager)
+    if not is_oauth_enabled():
+        # OAuth is disabled - return 404
+        return not_found_response()
+
+    oauth_handler = get_oauth2_handler()
     
     path = server.path_without_query
     method = getattr(server, 'method', 'GET')
@@ -1681,30 +2175,9 @@ def handle_oauth2_request(server):
     
     # Route to appropriate handler based on path
     try:
-        if path == "/oauth2/register" and method == "POST":
-            # Dynamic Client Registration
-            status, response_headers, content = oauth_handler.handle_client_registration(body)
-        
-        elif path == "/oauth2/authorize" and method == "GET":
-            # Authorization endpoint - show consent page
-            status, response_headers, content = oauth_handler.handle_authorization_request(query_params)
-        
-        elif path == "/oauth2/authorize_approve" and method == "POST":
-            # User approved/denied authorization
-            status, response_headers, content = oauth_handler.handle_authorization_approval(body)
-        
-        elif path == "/oauth2/token" and method == "POST":
-            # Token endpoint - exchange code for tokens or refresh
-            status, response_headers, content = oauth_handler.handle_token_request(body, headers)
-        
-        elif path == "/oauth2/introspect" and method == "POST":
-            # Token introspection
-            status, response_headers, content = oauth_handler.handle_introspection_request(body)
-        
-        elif path == "/oauth2/revoke" and method == "POST":
-            # Token revocation
-            status, response_headers, content = oauth_handler.handle_revocation_request(body)
-        
+        endpoint_handler = OAUTH2_ENDPOINT_HANDLERS.get((path, method))
+        if endpoint_handler is not None:
+            status, response_headers, content = endpoint_handler(oauth_handler, body, headers, query_params)
         else:
             # Unknown OAuth endpoint (built via the shared JSON helper, review D3)
             status, response_headers, content = _json_response("404 Not Found", {
@@ -1712,6 +2185,10 @@ def handle_oauth2_request(server):
                 "error_description": f"OAuth endpoint not found: {method} {path}"
             })
         
+        # Token/revoke/register calls can mint, rotate, revoke or prune tokens: never let
+        # validate_auth serve a pre-change lookup for them
+        invalidate_oauth_caches()
+        
         MCPLogger.log("OAuth2", f"{method} {path} -> {status}")
         
         # Merge response headers with content-type if not already set
@@ -1721,9 +2198,7 @@ def handle_oauth2_request(server):
         return status, response_headers, content
         
     except Exception as e:
-        MCPLogger.log("Error", f"OAuth2 handler failed: {e}")
-        import traceback
-        MCPLogger.log("Error", traceback.format_exc())
+        log_exception("Error", f"OAuth2 handler failed: {e}")
         return _json_response("500 Internal Server Error", {"error": "Internal server error", "details": str(e)})
 
 
@@ -1768,21 +2243,18 @@ def handle_status_api_request(server):
             "clients": client_count,
             "local_tools": local_tool_count,
             "remote_tools": remote_tool_count,
-            "version": get_server_version()
+            "version": get_server_version(server)
         }
         
         return _json_response("200 OK", response_data)
         
     except Exception as e:
-        MCPLogger.log("Status API", f"ERROR: {e}")
-        import traceback
-        MCPLogger.log("Status API", f"Traceback:\n{traceback.format_exc()}")
+        log_exception("Status API", f"ERROR: {e}")
         return _json_response("500 Internal Server Error", {"error": str(e)})
 
 
 def handle_tools_api_request(server):
     try:
-        from .shared_config import get_config_manager, SharedConfigManager
         
         config_manager = get_config_manager()
         config = config_manager.load_config()
@@ -1816,23 +2288,17 @@ def handle_tools_api_request(server):
         
         response_data = {"tools": tool_entries}
         
-        request_headers = getattr(server, 'headers', {})
-        requested_headers = request_headers.get('Access-Control-Request-Headers')
-        cors_headers = server._get_cors_headers(request_headers, requested_headers)
+        cors_headers = get_request_cors_headers(server)
         return _json_response("200 OK", response_data, cors_headers=cors_headers)
         
     except Exception as e:
-        MCPLogger.log("Tools API", f"ERROR: {e}")
-        import traceback
-        MCPLogger.log("Tools API", f"Traceback:\n{traceback.format_exc()}")
+        log_exception("Tools API", f"ERROR: {e}")
         return _json_response("500 Internal Server Error", {"error": str(e)})
 
 
 def handle_notify_tools_changed_request(server):
     try:
-        request_headers = getattr(server, 'headers', {})
-        requested_headers = request_headers.get('Access-Control-Request-Headers')
-        cors_headers = server._get_cors_headers(request_headers, requested_headers)
+        cors_headers = get_request_cors_headers(server)
         
         # Debounced (was a direct send) so a web-UI save that ALSO fires the config
         # callback (sync_disabled_tools_from_config) collapses into ONE frame -- see
@@ -1861,9 +2327,6 @@ def handle_users_list_request(server):
         }
     """
     try:
-        import getpass
-        import re
-        from .shared_config import get_config_manager, SharedConfigManager
         
         # Load config
         config_manager = get_config_manager()
@@ -1877,7 +2340,7 @@ def handle_users_list_request(server):
         user_list = sorted([u for u in authorized_users.keys() if u != '_internal'])
         
         # Get OS username and normalize it
-        os_username = getpass.getuser()
+        os_username = get_current_os_username()
         # Normalize: replace invalid chars with underscore (allows alphanumeric, _, -, .)
         normalized_os_username = re.sub(r'[^a-zA-Z0-9_.-]', '_', os_username)
         
@@ -1894,9 +2357,7 @@ def handle_users_list_request(server):
         return _json_response("200 OK", response_data, indent=2)
         
     except Exception as e:
-        MCPLogger.log("Users API", f"ERROR: {e}")
-        import traceback
-        MCPLogger.log("Users API", f"Traceback:\n{traceback.format_exc()}")
+        log_exception("Users API", f"ERROR: {e}")
         return _json_response("500 Internal Server Error", {"error": str(e)})
 
 
@@ -1913,7 +2374,6 @@ def handle_user_details_request(server, username):
         }
     """
     try:
-        from .shared_config import get_config_manager, SharedConfigManager
         
         # Load config
         config_manager = get_config_manager()
@@ -1959,9 +2419,6 @@ def handle_user_create_request(server):
         }
     """
     try:
-        from .shared_config import get_config_manager, SharedConfigManager
-        from datetime import datetime
-        import re
         
         # Parse request body
         body = getattr(server, 'oauth_body', '')
@@ -1969,7 +2426,7 @@ def handle_user_create_request(server):
             return _json_response("400 Bad Request", {"error": "Empty request body"})
         
         try:
-            data = json.loads(body)
+            data = _json_loads(body)
         except json.JSONDecodeError as e:
             return _json_response("400 Bad Request", {"error": f"Invalid JSON: {str(e)}"})
         
@@ -2024,9 +2481,7 @@ def handle_user_create_request(server):
         return _json_response("201 Created", response_data, extra_headers={"Cache-Control": "no-store"}, indent=2)
         
     except Exception as e:
-        MCPLogger.log("Users API", f"ERROR: {e}")
-        import traceback
-        MCPLogger.log("Users API", f"Traceback:\n{traceback.format_exc()}")
+        log_exception("Users API", f"ERROR: {e}")
         return _json_response("500 Internal Server Error", {"error": str(e)})
 
 
@@ -2038,7 +2493,6 @@ def handle_user_delete_request(server, username):
         {"success": true, "message": "User 'username' deleted"}
     """
     try:
-        from .shared_config import get_config_manager, SharedConfigManager
         
         # Prevent deleting _internal
         if username == '_internal':
@@ -2090,7 +2544,6 @@ def handle_user_regenerate_key_request(server, username):
         }
     """
     try:
-        from .shared_config import get_config_manager, SharedConfigManager
         
         # Prevent regenerating _internal (it's ephemeral anyway)
         if username == '_internal':
@@ -2155,7 +2608,6 @@ def handle_user_mcp_json_request(server, username):
         }
     """
     try:
-        from .shared_config import get_config_manager, SharedConfigManager
         
         # Load config
         config_manager = get_config_manager()
@@ -2196,15 +2648,241 @@ def handle_user_mcp_json_request(server, username):
         return _json_response("200 OK", response_data, extra_headers={"Cache-Control": "no-store"}, indent=2)
         
     except Exception as e:
-        MCPLogger.log("Users API", f"ERROR: {e}")
-        import traceback
-        MCPLogger.log("Users API", f"Traceback:\n{traceback.format_exc()}")
+        log_exception("Users API", f"ERROR: {e}")
         return _json_response("500 Internal Server Error", {"error": str(e)})
 
 
+# Rendered homepage cache: maps (server_url, cdn_base, user, version, tool fingerprint) to
+# (utf-8 bytes, ETag). Bounded because stale keys (old tool sets) are never hit again.
+_HOMEPAGE_CACHE = {}
+_HOMEPAGE_CACHE_LOCK = threading.Lock()
+_HOMEPAGE_CACHE_MAX_ENTRIES = 32
+
+# HOMEPAGE_HTML pre-split at import into alternating literal / placeholder-name chunks
+# (odd indices are names), so a render is one pass and one join instead of five chained
+# full-page .replace() copies. Only these five placeholders are substituted; other braces
+# in the page (CSS, JS) are left alone exactly as before.
+HOMEPAGE_TEMPLATE_CHUNKS = tuple(re.split(r'\{(server_url|cdn_base|current_user|version|tool_sections)\}', HOMEPAGE_HTML))
+
+
+def _render_tool_section_html(name, tool):
+    """Render one tool's homepage block (name, parameter schema, description/readme)."""
+    return f"""<div class="tool">
+        <h3 class="tool-name">{name}</h3>
+        <details class="parameters-details">
+            <summary>Parameters Schema</summary>
+            <pre><code class="language-json">{html.escape(json.dumps(tool['parameters'], indent=2))}</code></pre>
+        </details>
+        {'<div class="tool-description with-readme markdown-content">' + html.escape(tool['description']) + '</div>' if 'readme' in tool else '<div class="tool-readme markdown-content">' + html.escape(tool['description']) + '</div>'}
+        {'<div class="tool-readme markdown-content">' + html.escape(tool['readme']) + '</div>' if 'readme' in tool and tool['readme'] else ''}
+    </div>"""
+
+
+def _local_tools_fingerprint(local_tools_list):
+    """Digest of everything _render_tool_section_html shows for the local tools.
+
+    Local tools can change description/readme/schema without changing name, so the
+    homepage cache key must cover the rendered metadata, not just the names.
+    """
+    rendered_metadata = [
+        (tool.get('name'), tool.get('description'), tool.get('readme'), tool.get('parameters'))
+        for tool in local_tools_list
+    ]
+    return hashlib.blake2b(json.dumps(rendered_metadata, sort_keys=True, default=str).encode('utf-8'), digest_size=16).digest()
+
+
+def _render_homepage(server_url, cdn_base, current_user, version, local_tools_list, remote_tools_items):
+    """Render the full homepage HTML for the given user and tool lists.
+
+    Pure function of its arguments, which is what lets handle_default_request cache the
+    encoded result. Note: no {api_key} substitution - the key is fetched client-side.
+    """
+    tool_sections = ['<h2>Built-in Tools</h2>']
+    tool_sections.extend(_render_tool_section_html(tool['name'], tool) for tool in ORIGINAL_TOOLS)
+
+    if local_tools_list:
+        tool_sections.append('<h2>Local STDIO Tools</h2>')
+        tool_sections.extend(_render_tool_section_html(tool['name'], tool) for tool in local_tools_list)
+
+    if remote_tools_items:
+        tool_sections.append('<h2>Remote Network Tools</h2>')
+        tool_sections.extend(_render_tool_section_html(name, tool) for name, tool in remote_tools_items)
+
+    template_values = {
+        'server_url': server_url,
+        'cdn_base': cdn_base,
+        'current_user': current_user,
+        'version': version,
+        'tool_sections': ''.join(tool_sections),
+    }
+    rendered_parts = list(HOMEPAGE_TEMPLATE_CHUNKS)
+    rendered_parts[1::2] = [template_values[name] for name in HOMEPAGE_TEMPLATE_CHUNKS[1::2]]
+    return ''.join(rendered_parts)
+
+
+@functools.lru_cache(maxsize=4)
+def homepage_base_headers(cdn_domain):
+    """Return the homepage's fixed response headers (CSP etc.) for a CDN origin.
+
+    cdn_domain only varies with the protocol, so the CSP string is built once per value.
+    Treat the result as read-only; callers merge it into their own dict.
+    """
+    return types.MappingProxyType({
+        "Content-Type": "text/html; charset=utf-8",
+        "Cache-Control": "private, no-cache",  # always revalidate: the tool list can change
+        "Cross-Origin-Opener-Policy": "same-origin",
+        "Cross-Origin-Embedder-Policy": "require-corp",
+        "Cross-Origin-Resource-Policy": "cross-origin",
+        "Content-Security-Policy": f"default-src 'self'; "
+            f"script-src 'self' 'unsafe-inline' {cdn_domain}; "
+            f"style-src 'self' 'unsafe-inline' {cdn_domain}; "
+            f"img-src 'self' data: {cdn_domain}; "
+            f"connect-src 'self' {cdn_domain}; "
+            f"frame-ancestors 'self'"
+    })
+
+
+@functools.lru_cache(maxsize=8)
+def build_oauth_discovery_body(protocol, host, port):
+    """Return the OAuth authorization-server metadata document as JSON bytes.
+
+    The document only depends on where we are listening, so it is built and serialized
+    once per (protocol, host, port) rather than on every discovery request; the enabled
+    check stays in the caller (is_oauth_enabled).
+    """
+    base_as = f"{protocol}://{host}:{port}" # authorization server
+    base_rs = f"{protocol}://{host}:{port}" # resource server
+    
+    #Create OAuth metadata response
+    oauth_metadata = {
+        "issuer": f"{base_as}",
+        "authorization_endpoint": f"{base_as}/oauth2/authorize",
+        "token_endpoint": f"{base_as}/oauth2/token",
+        "registration_endpoint": f"{base_as}/oauth2/register",
+        "introspection_endpoint": f"{base_as}/oauth2/introspect",
+        "revocation_endpoint": f"{base_as}/oauth2/revoke",
+
+        # Add this the day you implement device flow:
+        # "device_authorization_endpoint": f"{base_as}/oauth2/device_authorization",
+
+        # Opaque tokens: no jwks yet
+        # "jwks_uri": f"{base_as}/oauth2/jwks.json",
+
+        # Add these when implemented:
+        # "pushed_authorization_request_endpoint": f"{base_as}/oauth2/par",
+
+        "grant_types_supported": [
+            "authorization_code",
+            "refresh_token"
+            # add when implemented: "client_credentials",
+            # add when implemented: "urn:ietf:params:oauth:grant-type:device_code"
+        ],
+        "response_types_supported": [ "code" ],
+        "response_modes_supported": [ "query", "form_post" ],
+        "code_challenge_methods_supported": [ "S256" ],
+
+        # List only methods you truly accept at /oauth2/token
+        "token_endpoint_auth_methods_supported": [
+            "client_secret_basic",
+            "client_secret_post",
+            "none"
+        ],
+
+        "scopes_supported": [ "offline_access" ],
+
+        # OIDC request object features ? keep False
+        "claims_parameter_supported": False,
+        "request_parameter_supported": False,
+        "request_uri_parameter_supported": False
+    }
+
+    return _json_dumps_bytes(oauth_metadata, indent=2)
+
+
+#Old: Create OAuth metadata response
+#oauth_metadata = {
+#    "issuer": f"{base_rs}/sse",
+#    "authorization_endpoint": f"{base_as}/oauth2/authorize",
+#    "token_endpoint": f"{base_as}/oauth2/token",
+#    "device_authorization_endpoint": f"{base_as}/oauth2/device_authorization",
+#    "revocation_endpoint": f"{base_as}/oauth2/revoke",
+#    "introspection_endpoint": f"{base_as}/oauth2/introspect",
+#    "pushed_authorization_request_endpoint": f"{base_as}/oauth2/par",
+#    "jwks_uri": f"{base_as}/oauth2/jwks.json",
+#    "grant_types_supported": ["authorization_code", "refresh_token", "client_credentials", "urn:ietf:params:oauth:grant-type:device_code"],
+#    "response_types_supported": ["code"],
+#    "response_modes_supported": ["query", "form_post"],
+#    "code_challenge_methods_supported": ["S256"],
+#    "token_endpoint_auth_methods_supported": [ "client_secret_basic", "client_secret_post", "private_key_jwt", "none" ],
+#    #"scopes_supported": ["openid", "email", "profile", "offline_access"]
+#    "scopes_supported": [ "offline_access" ],
+#    "claims_parameter_supported": False,
+#    "request_parameter_supported": False,
+#    "request_uri_parameter_supported": False
+#}
+
+
+def handle_oauth_discovery_request(server):
+    """Serve the OAuth authorization-server metadata, or 404 when OAuth is disabled.
+
+    Routed for every path in OAUTH_DISCOVERY_PATHS, the same canonical set as the OAuth
+    allow-list in check_global_auth; otherwise an unauthenticated discovery request that
+    global auth permits would match no route and fall through toward the homepage
+    (review A1).
+    """
+    if not is_oauth_enabled():
+        # OAuth is disabled - return 404
+        return not_found_response()
+
+    # Determine if we're running in HTTPS mode using the server's enable_https attribute
+    protocol = "https" if server.enable_https else "http"
+    return "200 OK", {
+        "Content-Type": "application/json",
+        "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
+    }, build_oauth_discovery_body(protocol, server.host, server.port)
+
+
+def handle_favicon_request(server):
+    """Serve the favicon (decoded once at import), answering revalidations with 304.
+
+    This is the live (and only) route that serves it - check_global_auth exempts the
+    path from authentication so browsers' automatic requests succeed (review B6).
+    """
+    if request_etag_matches(server.headers, FAVICON_ETAG):
+        not_modified_headers = dict(FAVICON_RESPONSE_HEADERS)
+        del not_modified_headers["Content-Length"]
+        return "304 Not Modified", not_modified_headers, b""
+    return "200 OK", dict(FAVICON_RESPONSE_HEADERS), FAVICON_BYTES
+
+
+# Routing tables for handle_default_request. /settings redirects the legacy path to the
+# static popover page (review A9); /oauth2/ checks is_oauth_enabled in its handler.
+EXACT_PATH_ROUTES = {
+    "/api/status": handle_status_api_request,
+    "/api/tools": handle_tools_api_request,
+    # UI calls this after its debounce when tool visibility changes
+    "/api/notify_tools_changed": handle_notify_tools_changed_request,
+    "/settings": handle_settings_request,
+    "/favicon.ico": handle_favicon_request,
+}
+EXACT_PATH_ROUTES.update(dict.fromkeys(OAUTH_DISCOVERY_PATHS, handle_oauth_discovery_request))
+
+PREFIX_PATH_ROUTES = (
+    ("/pages/", handle_static_request),
+    ("/scripts/", handle_static_request),
+    ("/api/settings", handle_settings_api_request),
+    ("/oauth2/", handle_oauth2_request),
+)
+
+
 def handle_default_request(server):
     """Handle requests to the homepage and other default paths"""
     
+    # Start every request without a shared config copy or CORS headers (see
+    # get_request_config / get_request_cors_headers)
+    server._request_config = None
+    server._request_cors_headers = None
+    
     # Get client address for logging (needed in both auth modes)
     client_address = getattr(server, 'current_client_address', None)
     
@@ -2212,24 +2890,13 @@ def handle_default_request(server):
     # If global auth is enabled, the user is already authenticated by check_global_auth
     if DISABLE_AUTH:
         # Extract authentication from both headers and URL parameters
-        auth_header = server.headers.get('Authorization') or server.headers.get('authorization')
+        auth_header = get_request_header(server.headers, 'Authorization')
         
         # Extract URL parameters for authentication
-        url_user = None
-        url_api_key = None
-        if hasattr(server, 'query_params'):
-            # Get user parameter (check both 'user' and 'username')
-            user_params = server.query_params.get('user', []) + server.query_params.get('username', [])
-            if user_params:
-                url_user = user_params[0]
-            
-            # Get API key parameter
-            api_key_params = server.query_params.get('RAGTAG_API_KEY', [])
-            if api_key_params:
-                url_api_key = api_key_params[0]
+        url_user, url_api_key = get_url_auth_params(server)
         
         # Get host header for hostname-based UUID authentication
-        host_header = server.headers.get('host') or server.headers.get('Host')
+        host_header = get_request_header(server.headers, 'Host')
         
         is_valid, username = validate_auth(auth_header, url_user, url_api_key, client_address, host_header)
         
@@ -2245,25 +2912,16 @@ def handle_default_request(server):
     
     # Authentication successful or disabled
 
-    # Handle static files (pages and scripts)
-    if server.path_without_query.startswith("/pages/") or server.path_without_query.startswith("/scripts/"):
-        return handle_static_request(server)
-
-    # Handle settings API
-    if server.path_without_query.startswith("/api/settings"):
-        return handle_settings_api_request(server)
-
-    # Handle status API
-    if server.path_without_query == "/api/status":
-        return handle_status_api_request(server)
-
-    # Handle tools API
-    if server.path_without_query == "/api/tools":
-        return handle_tools_api_request(server)
-
-    # Handle tool visibility change notification (UI calls this after debounce)
-    if server.path_without_query == "/api/notify_tools_changed":
-        return handle_notify_tools_changed_request(server)
+    # Fixed paths are one dict lookup; prefixed paths (static files, settings API, OAuth)
+    # a short scan. Users API paths are method-dependent and stay below.
+    route_handler = EXACT_PATH_ROUTES.get(server.path_without_query)
+    if route_handler is None:
+        for route_prefix, prefix_handler in PREFIX_PATH_ROUTES:
+            if server.path_without_query.startswith(route_prefix):
+                route_handler = prefix_handler
+                break
+    if route_handler is not None:
+        return route_handler(server)
 
     # Handle user management API
     # Normalize path (remove trailing slashes to handle /api/users/cnd/ correctly)
@@ -2313,152 +2971,13 @@ def handle_default_request(server):
                     headers = {"Allow": "GET", "Content-Type": "text/plain"}
                     return "405 Method Not Allowed", headers, "Method not allowed"
 
-    # Handle settings page: redirect the legacy /settings path to the static popover page,
-    # which is served (with template expansion) through handle_static_request (review A9).
-    if server.path_without_query == "/settings":
-        return handle_settings_request(server)
-
-
-    #Old: Create OAuth metadata response
-    #oauth_metadata = {
-    #    "issuer": f"{base_rs}/sse",
-    #    "authorization_endpoint": f"{base_as}/oauth2/authorize",
-    #    "token_endpoint": f"{base_as}/oauth2/token",
-    #    "device_authorization_endpoint": f"{base_as}/oauth2/device_authorization",
-    #    "revocation_endpoint": f"{base_as}/oauth2/revoke",
-    #    "introspection_endpoint": f"{base_as}/oauth2/introspect",
-    #    "pushed_authorization_request_endpoint": f"{base_as}/oauth2/par",
-    #    "jwks_uri": f"{base_as}/oauth2/jwks.json",
-    #    "grant_types_supported": ["authorization_code", "refresh_token", "client_credentials", "urn:ietf:params:oauth:grant-type:device_code"],
-    #    "response_types_supported": ["code"],
-    #    "response_modes_supported": ["query", "form_post"],
-    #    "code_challenge_methods_supported": ["S256"],
-    #    "token_endpoint_auth_methods_supported": [ "client_secret_basic", "client_secret_post", "private_key_jwt", "none" ],
-    #    #"scopes_supported": ["openid", "email", "profile", "offline_access"]
-    #    "scopes_supported": [ "offline_access" ],
-    #    "claims_parameter_supported": False,
-    #    "request_parameter_supported": False,
-    #    "request_uri_parameter_supported": False
-    #}
-
-
-    # Handle OAuth discovery endpoint. This uses the same canonical path set as the OAuth
-    # allow-list in check_global_auth; otherwise an unauthenticated discovery request that
-    # global auth permits would match no route here and fall through toward the homepage
-    # (review A1).
-    if server.path_without_query in OAUTH_DISCOVERY_PATHS:
-        # Check if OAuth is enabled
-        from .shared_config import get_config_manager
-        config_manager = get_config_manager()
-        config = config_manager.load_config()
-        oauth_config = config.get("settings", [{}])[0].get("oauth", {})
-        oauth_enabled = oauth_config.get("enabled", False)
-        
-        if not oauth_enabled:
-            # OAuth is disabled - return 404
-            return "404 Not Found", {
-                "Content-Type": "text/plain; charset=utf-8",
-                "Cache-Control": "no-store"
-            }, "Not Found"
-        
-        # Determine if we're running in HTTPS mode using the server's enable_https attribute
-        enable_https = server.enable_https
-        protocol = "https" if enable_https else "http"
-        host = server.host
-        port = server.port
-        base_as = f"{protocol}://{host}:{port}" # authorization server
-        base_rs = f"{protocol}://{host}:{port}" # resource server
-        
-        #Create OAuth metadata response
-        oauth_metadata = {
-            "issuer": f"{base_as}",
-            "authorization_endpoint": f"{base_as}/oauth2/authorize",
-            "token_endpoint": f"{base_as}/oauth2/token",
-            "registration_endpoint": f"{base_as}/oauth2/register",
-            "introspection_endpoint": f"{base_as}/oauth2/introspect",
-            "revocation_endpoint": f"{base_as}/oauth2/revoke",
-
-            # Add this the day you implement device flow:
-            # "device_authorization_endpoint": f"{base_as}/oauth2/device_authorization",
-
-            # Opaque tokens: no jwks yet
-            # "jwks_uri": f"{base_as}/oauth2/jwks.json",
-
-            # Add these when implemented:
-            # "pushed_authorization_request_endpoint": f"{base_as}/oauth2/par",
-
-            "grant_types_supported": [
-                "authorization_code",
-                "refresh_token"
-                # add when implemented: "client_credentials",
-                # add when implemented: "urn:ietf:params:oauth:grant-type:device_code"
-            ],
-            "response_types_supported": [ "code" ],
-            "response_modes_supported": [ "query", "form_post" ],
-            "code_challenge_methods_supported": [ "S256" ],
-
-            # List only methods you truly accept at /oauth2/token
-            "token_endpoint_auth_methods_supported": [
-                "client_secret_basic",
-                "client_secret_post",
-                "none"
-            ],
-
-            "scopes_supported": [ "offline_access" ],
-
-            # OIDC request object features ? keep False
-            "claims_parameter_supported": False,
-            "request_parameter_supported": False,
-            "request_uri_parameter_supported": False
-        }
-
-        oauth_json = json.dumps(oauth_metadata, indent=2)
-        return "200 OK", {
-            "Content-Type": "application/json",
-            "Cache-Control": "public, max-age=3600"  # Cache for 1 hour
-        }, oauth_json
-
-    # Handle OAuth 2.0 endpoints
-    if server.path_without_query.startswith("/oauth2/"):
-        # Check if OAuth is enabled
-        from .shared_config import get_config_manager
-        config_manager = get_config_manager()
-        config = config_manager.load_config()
-        oauth_config = config.get("settings", [{}])[0].get("oauth", {})
-        oauth_enabled = oauth_config.get("enabled", False)
-        
-        if not oauth_enabled:
-            # OAuth is disabled - return 404
-            return "404 Not Found", {
-                "Content-Type": "text/plain; charset=utf-8",
-                "Cache-Control": "no-store"
-            }, "Not Found"
-        
-        return handle_oauth2_request(server)
-    
-    # Favicon: this is the live (and only) route that serves it - check_global_auth exempts
-    # the path from authentication so browsers' automatic requests succeed, then routing
-    # falls through to here (review B6: the old comment wrongly claimed a global handler).
-    if server.path_without_query == "/favicon.ico": 
-        #import base64
-        # Decode base64 to bytes - only do this once per request
-        favicon_bytes = base64.b64decode(FAVICON_B64)
-        
-        return "200 OK", {
-            "Content-Type": "image/x-icon",
-            "Cache-Control": "public, max-age=31536000"  # Cache for 1 year
-        }, favicon_bytes
-
     # Never serve the homepage (which contains server config) to a request that has not
     # authenticated a user. In global-auth mode the only way an unauthenticated request
     # reaches this point is via the OAuth allow-list, which sets authenticated_user=None;
     # refuse it here so the config/key block is never exposed to an anonymous caller
     # (review A1/A2/B1).
     if not DISABLE_AUTH and not username:
-        return "404 Not Found", {
-            "Content-Type": "text/plain; charset=utf-8",
-            "Cache-Control": "no-store"
-        }, "Not Found"
+        return not_found_response()
 
     # Serve the homepage
     client_ip = f"{client_address[0]}:{client_address[1]}" if client_address else "unknown"
@@ -2481,75 +3000,46 @@ def handle_default_request(server):
     # runtime, so the key never lands in page HTML/browser cache/proxies, and no fabricated
     # random key is shown when the user has none (review A2/A8/B1/D1).
     current_user = username  # Use the authenticated username
-    version = get_server_version()
-    
-    # Generate dynamic tool sections HTML
-    tool_sections_html = ""
+    version = get_server_version(server)
     
-    # Built-in Tools
-    tool_sections_html += '<h2>Built-in Tools</h2>'
-    for tool in ORIGINAL_TOOLS:
-        tool_sections_html += f"""<div class="tool">
-        <h3 class="tool-name">{tool['name']}</h3>
-        <details class="parameters-details">
-            <summary>Parameters Schema</summary>
-            <pre><code class="language-json">{html.escape(json.dumps(tool['parameters'], indent=2))}</code></pre>
-        </details>
-        {'<div class="tool-description with-readme markdown-content">' + html.escape(tool['description']) + '</div>' if 'readme' in tool else '<div class="tool-readme markdown-content">' + html.escape(tool['description']) + '</div>'}
-        {'<div class="tool-readme markdown-content">' + html.escape(tool['readme']) + '</div>' if 'readme' in tool else ''}
-    </div>"""
-
-    # Local STDIO Tools
+    # The rendered page is cached per (url, user, version, tool metadata) so repeat views skip
+    # all the per-tool json.dumps/html.escape work; the ETag lets browsers revalidate with
+    # a bodyless 304 instead of re-downloading the page.
     try:
-        local_tools_list = local_tools.get_dynamic_tools()
-        if local_tools_list:
-            tool_sections_html += '<h2>Local STDIO Tools</h2>'
-            for tool in local_tools_list:
-                tool_sections_html += f"""<div class="tool">
-        <h3 class="tool-name">{tool['name']}</h3>
-        <details class="parameters-details">
-            <summary>Parameters Schema</summary>
-            <pre><code class="language-json">{html.escape(json.dumps(tool['parameters'], indent=2))}</code></pre>
-        </details>
-        {'<div class="tool-description with-readme markdown-content">' + html.escape(tool['description']) + '</div>' if 'readme' in tool else '<div class="tool-readme markdown-content">' + html.escape(tool['description']) + '</div>'}
-        {'<div class="tool-readme markdown-content">' + html.escape(tool['readme']) + '</div>' if 'readme' in tool else ''}
-    </div>"""
+        local_tools_list = local_tools.get_dynamic_tools() or []
     except Exception as e:
         MCPLogger.log("Error", f"Failed to get local tools for homepage: {e}")
-
-    # Remote Network Tools
+        local_tools_list = []
     try:
-        if remote_tools.registered_tools:
-            tool_sections_html += '<h2>Remote Network Tools</h2>'
-            for name, tool in remote_tools.registered_tools.items():
-                tool_sections_html += f"""<div class="tool">
-        <h3 class="tool-name">{name}</h3>
-        <details class="parameters-details">
-            <summary>Parameters Schema</summary>
-            <pre><code class="language-json">{html.escape(json.dumps(tool['parameters'], indent=2))}</code></pre>
-        </details>
-        {'<div class="tool-description with-readme markdown-content">' + html.escape(tool['description']) + '</div>' if 'readme' in tool else '<div class="tool-readme markdown-content">' + html.escape(tool['description']) + '</div>'}
-        {'<div class="tool-readme markdown-content">' + html.escape(tool['readme']) + '</div>' if 'readme' in tool and tool['readme'] else ''}
-    </div>"""
+        remote_tools_snapshot = list(remote_tools.registered_tools.items())
     except Exception as e:
         MCPLogger.log("Error", f"Failed to get remote tools for homepage: {e}")
+        remote_tools_snapshot = []
 
-    # Fill the template with the actual server URL, CDN paths, current user, version, and tool
-    # sections. Note: no {api_key} substitution - the key is fetched client-side (see above).
-    homepage_html = HOMEPAGE_HTML.replace('{server_url}', server_url).replace('{cdn_base}', cdn_base).replace('{current_user}', current_user).replace('{version}', version).replace('{tool_sections}', tool_sections_html)
+    cache_key = (
+        server_url, cdn_base, current_user, version,
+        _local_tools_fingerprint(local_tools_list),
+        tuple((name, tool.get('registered_at')) for name, tool in remote_tools_snapshot),
+    )
+    with _HOMEPAGE_CACHE_LOCK:
+        cached_page = _HOMEPAGE_CACHE.get(cache_key)
+    if cached_page is None:
+        homepage_bytes = _render_homepage(server_url, cdn_base, current_user, version, local_tools_list, remote_tools_snapshot).encode('utf-8')
+        homepage_etag = '"' + hashlib.blake2b(homepage_bytes, digest_size=8).hexdigest() + '"'
+        cached_page = (homepage_bytes, homepage_etag)
+        with _HOMEPAGE_CACHE_LOCK:
+            # Keys only go stale (old tool sets/versions), so a full reset is enough to bound it
+            if len(_HOMEPAGE_CACHE) >= _HOMEPAGE_CACHE_MAX_ENTRIES:
+                _HOMEPAGE_CACHE.clear()
+            _HOMEPAGE_CACHE[cache_key] = cached_page
+    homepage_bytes, homepage_etag = cached_page
 
-    return "200 OK", {
-        "Content-Type": "text/html; charset=utf-8",
-        "Cross-Origin-Opener-Policy": "same-origin",
-        "Cross-Origin-Embedder-Policy": "require-corp",
-        "Cross-Origin-Resource-Policy": "cross-origin",
-        "Content-Security-Policy": f"default-src 'self'; "
-            f"script-src 'self' 'unsafe-inline' {cdn_domain}; "
-            f"style-src 'self' 'unsafe-inline' {cdn_domain}; "
-            f"img-src 'self' data: {cdn_domain}; "
-            f"connect-src 'self' {cdn_domain}; "
-            f"frame-ancestors 'self'"
-    }, homepage_html
+    headers = {**homepage_base_headers(cdn_domain), "ETag": homepage_etag}
+
+    if request_etag_matches(server.headers, homepage_etag):
+        return "304 Not Modified", headers, b""
+
+    return "200 OK", headers, homepage_bytes
 
 
 def main(fris): # fris is the "self." from the caller (friday.py)
@@ -2577,12 +3067,16 @@ def main(fris): # fris is the "self." from the caller (friday.py)
     
     args = parser.parse_args()
     
-    # Initialize ragtag configuration (load/create ragtag.json)
-    UNUSED, master_dir = manage_ragtag_config(fris)
+    # Pending config writes must survive a service/container stop (SIGTERM)
+    install_sigterm_flush()
     
-    # Synchronize mcpServers.mypc URL from server configuration
-    from .shared_config import sync_mcpservers_synthetic_entry_from_server_config
-    sync_mcpservers_synthetic_entry_from_server_config()
+    # Both startup config updates below land in one file write
+    with get_config_manager().batched_config_updates():
+        # Initialize ragtag configuration (load/create ragtag.json)
+        UNUSED, master_dir = manage_ragtag_config(fris)
+        
+        # Synchronize mcpServers.mypc URL from server configuration
+        sync_mcpservers_synthetic_entry_from_server_config()
     
     # Get connection info
     enable_https, cert_path, key_path, ca_path = get_connection_info(args, master_dir)
@@ -2596,9 +3090,8 @@ def main(fris): # fris is the "self." from the caller (friday.py)
         the synthetic "mypc" entry, which is this server's own), and only fall back to the
         first Bearer entry if none match.
         """
-        from .shared_config import get_config_manager
         config_manager = get_config_manager()
-        full_config = config_manager.load_config()
+        full_config = config_manager.get_config_readonly()  # read-only: no deep copy needed
 
         # Extract API key from mcpServers section (not ephemeral, persists across restarts)
         mcp_servers = full_config.get("mcpServers", {})
@@ -2725,6 +3218,7 @@ def main(fris): # fris is the "self." from the caller (friday.py)
     MCPLogger.log("Server", f"Aura Friday's mcp-link server v{VERSION}")
     
     # Register tools
+    registered_tool_names = []
     for tool in ALL_TOOLS:
         # COR-003 guard: a module can define TOOLS without a matching handler (missing
         # handle_<name> / HANDLERS entry). Skip such a tool instead of indexing
@@ -2733,21 +3227,21 @@ def main(fris): # fris is the "self." from the caller (friday.py)
         if tool["name"] not in HANDLERS:
             MCPLogger.log("Server", f"Skipping tool '{tool['name']}': no handler registered; excluded from registration")
             continue
-        # Keep registration logging concise: the previous per-tool dump of the full tool dict
-        # and the ENTIRE HANDLERS map (with handler identities) was extremely noisy and leaked
-        # internal detail on every tool (review C1). One line per tool is enough.
-        MCPLogger.log("Server", f"Registering tool: {tool['name']}")
         server.register_tool(
             name=tool["name"],
             description=tool["description"],
             input_schema=tool["parameters"],
             handler=HANDLERS[tool["name"]]
         )
+        registered_tool_names.append(tool["name"])
+    # Keep registration logging concise: the previous per-tool dump of the full tool dict
+    # and the ENTIRE HANDLERS map (with handler identities) was extremely noisy and leaked
+    # internal detail on every tool (review C1). One summary line for all tools is enough.
+    MCPLogger.log("Server", f"Registered {len(registered_tool_names)} tools: {', '.join(registered_tool_names)}")
     
     # Load initial tool visibility state from config into the in-memory set,
     # and register a callback so it stays in sync when config changes.
     try:
-        from .shared_config import get_config_manager
         tool_visibility_config_manager = get_config_manager()
         initial_config_for_tool_visibility = tool_visibility_config_manager.load_config()
         server.sync_disabled_tools_from_config(initial_config_for_tool_visibility)
@@ -2774,9 +3268,7 @@ def main(fris): # fris is the "self." from the caller (friday.py)
             result = manager.auto_register_on_startup(server_config)
             MCPLogger.log("Server", f"Auto-registration completed. Full result: {result}")
         except Exception as e:
-            MCPLogger.log("Warning", f"Auto-registration failed: {e}")
-            import traceback
-            MCPLogger.log("Warning from Auto-registration", traceback.format_exc())
+            log_exception("Warning", f"Auto-registration failed: {e}")
 
     try:
         api_key = get_api_key_from_config()
@@ -2811,9 +3303,7 @@ def main(fris): # fris is the "self." from the caller (friday.py)
             threading.Thread(target=delayed_auto_register, args=(reg_config,), daemon=True).start()
         
     except Exception as e:
-        MCPLogger.log("Warning", f"Auto-registration setup failed: {e}")
-        import traceback
-        MCPLogger.log("Warning", traceback.format_exc())
+        log_exception("Warning", f"Auto-registration setup failed: {e}")
 
     # Start server
     try:
@@ -2825,10 +3315,9 @@ def main(fris): # fris is the "self." from the caller (friday.py)
         
         # Handle restart if that was the reason
         if reason == "restart":
-            # Get command details again
-            executable = sys.executable
-            script_path = os.path.abspath(sys.argv[0])
-            args = [a for a in sys.argv[1:]]
+            # Get command details
+            executable, script_path, args = get_restart_command()
+            args = list(args)
             
             # Give connected IDEs (e.g. Cursor) a few seconds to notice the disconnect and
             # drop their old session before the replacement process rebinds the port.
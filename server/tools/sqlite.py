@@ -41,7 +41,7 @@ from pathlib import Path
 from easy_mcp.server import MCPLogger, get_tool_token
 from .qwen_embedding_06 import generate_embedding
 from . import get_authenticated_user
-from ragtag.shared_config import get_user_data_directory, get_ragtag_config
+from ragtag.shared_config import get_user_data_directory, get_ragtag_setting
 from platformdirs import user_data_dir, user_log_dir, user_cache_dir, user_config_dir, site_data_dir
 import tempfile
 try:
@@ -631,7 +631,7 @@ def _get_confinement_root_directory_or_none() -> Optional[str]:
         Absolute confinement root directory, or None when confinement is not configured.
     """
     try:
-        configured_root = get_ragtag_config().get("sqlite_confine_database_paths_to_directory")
+        configured_root = get_ragtag_setting("sqlite_confine_database_paths_to_directory")
         if configured_root and isinstance(configured_root, str):
             return os.path.abspath(os.path.expandvars(os.path.expanduser(configured_root)))
     except Exception as config_error:
@@ -1455,7 +1455,7 @@ def _generate_api_key_collection_html(service_name: str, service_url: str) -> st
     # Get server configuration to construct API endpoint URL
     from ragtag.shared_config import get_config_manager
     config_manager = get_config_manager()
-    server_config = config_manager.get_server_config()
+    server_config = config_manager.get_server_config_readonly()  # read-only: no copy needed
     
     # Extract server details
     host = server_config.get("host", "127-0-0-1.local.aurafriday.com")